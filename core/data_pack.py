@@ -0,0 +1,190 @@
+# ════════════════════════════════════════════════════════════════
+# 📦 DATA_PACK.PY - DADOS DO JOGO COMPILADOS NUM ARQUIVO SÓ
+# ════════════════════════════════════════════════════════════════
+#
+# Compila todos os JSON de data/ (lang.json, quest_data.json, heróis,
+# diálogos, quests) em data/data.pack. Com o pack presente e atualizado,
+# a inicialização lê um arquivo só e desserializa com marshal em vez de
+# fazer o parsing de ~190 JSONs; sem ele (ou desatualizado), os
+# loaders leem os JSON como sempre.
+#
+# Gerar / conferir (a partir da raiz do projeto):
+#   python -m core.data_pack
+#   python -m core.data_pack --check
+#
+# Layout (little-endian):
+#   MAGIC "GQDP" | versão u16 | marshal.version u16 | sha256 do corpo
+#   | tamanho do manifesto u32 | manifesto | corpo
+#
+# Manifesto: {caminho relativo: (tamanho, mtime_ns)} de cada JSON — o
+# pack só vale se bater com os arquivos em disco.
+# Corpo: {caminho relativo: marshal do conteúdo}; cada arquivo é
+# desserializado só quando pedido, e cada chamada devolve objetos novos.
+#
+# ════════════════════════════════════════════════════════════════
+
+import argparse
+import hashlib
+import json
+import marshal
+import os
+import struct
+
+DATA_DIR = "data"
+PACK_FILE = "data.pack"  # dentro de DATA_DIR
+PACK_VERSION = 1
+MAGIC = b"GQDP"
+
+_HEADER = struct.Struct("<4sHH32sI")
+
+
+class DataPack:
+    def __init__(self, files: dict, content_hash: str):
+        self.files = files              # {caminho relativo: bytes (marshal)}
+        self.content_hash = content_hash
+
+    def __contains__(self, relpath: str) -> bool:
+        return relpath in self.files
+
+    def load(self, relpath: str):
+        return marshal.loads(self.files[relpath])
+
+
+# ════════════════════════════════════════════════════════════════
+# BUILD
+# ════════════════════════════════════════════════════════════════
+
+def _scan_json_files(data_dir: str) -> dict:
+    """{caminho relativo: (tamanho, mtime_ns)} de todos os JSON de data_dir."""
+    manifest = {}
+    for root, _, files in os.walk(data_dir):
+        for name in files:
+            if not name.endswith(".json"):
+                continue
+            path = os.path.join(root, name)
+            stat = os.stat(path)
+            manifest[_relpath(path, data_dir)] = (stat.st_size, stat.st_mtime_ns)
+    return manifest
+
+
+def _relpath(path, data_dir: str) -> str:
+    return os.path.relpath(os.path.abspath(path), os.path.abspath(data_dir)).replace(os.sep, "/")
+
+
+def build_data_pack(data_dir: str = DATA_DIR) -> str:
+    """Compila os JSON de data_dir em data_dir/PACK_FILE. Devolve o caminho do pack."""
+    manifest = _scan_json_files(data_dir)
+
+    files = {}
+    for relpath in sorted(manifest):
+        with open(os.path.join(data_dir, relpath), "r", encoding="utf-8") as f:
+            files[relpath] = marshal.dumps(json.load(f))
+
+    body = marshal.dumps(files)
+    manifest_raw = marshal.dumps(manifest)
+    header = _HEADER.pack(
+        MAGIC, PACK_VERSION, marshal.version,
+        hashlib.sha256(body).digest(), len(manifest_raw),
+    )
+
+    pack_path = os.path.join(data_dir, PACK_FILE)
+    tmp_path = pack_path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(header + manifest_raw + body)
+    os.replace(tmp_path, pack_path)
+
+    invalidate_data_pack()
+    return pack_path
+
+
+# ════════════════════════════════════════════════════════════════
+# LEITURA
+# ════════════════════════════════════════════════════════════════
+
+def read_data_pack(data_dir: str = DATA_DIR) -> DataPack | None:
+    """Lê o pack se existir, estiver íntegro e bater com os JSON atuais; senão None."""
+    pack_path = os.path.join(data_dir, PACK_FILE)
+    try:
+        with open(pack_path, "rb") as f:
+            raw = f.read()
+    except FileNotFoundError:
+        return None
+
+    try:
+        magic, version, marshal_version, digest, manifest_size = _HEADER.unpack_from(raw, 0)
+        if magic != MAGIC or version != PACK_VERSION or marshal_version != marshal.version:
+            print("📦 Data pack de outra versão - usando os JSON")
+            return None
+
+        offset = _HEADER.size
+        manifest = marshal.loads(raw[offset:offset + manifest_size])
+        if manifest != _scan_json_files(data_dir):
+            print("📦 Data pack desatualizado - usando os JSON (rode python -m core.data_pack)")
+            return None
+
+        body = raw[offset + manifest_size:]
+        if hashlib.sha256(body).digest() != digest:
+            print("⚠️ Data pack corrompido - usando os JSON")
+            return None
+
+        return DataPack(marshal.loads(body), digest.hex())
+    except (struct.error, ValueError, EOFError, TypeError) as e:
+        print(f"⚠️ Data pack ilegível ({e}) - usando os JSON")
+        return None
+
+
+_data_pack = None
+_data_pack_checked = False
+
+def get_data_pack():
+    """Pack do DATA_DIR, lido e validado uma vez por processo (None se não vale)."""
+    global _data_pack, _data_pack_checked
+    if not _data_pack_checked:
+        _data_pack = read_data_pack(DATA_DIR)
+        _data_pack_checked = True
+    return _data_pack
+
+
+def invalidate_data_pack():
+    """Força reler o pack no próximo acesso (ex.: depois de editar os JSON)."""
+    global _data_pack, _data_pack_checked
+    _data_pack = None
+    _data_pack_checked = False
+
+
+def load_json(path):
+    """
+    Conteúdo de um JSON: do pack quando o arquivo está em DATA_DIR e o
+    pack é válido, senão do próprio arquivo (mesmas exceções de json.load).
+    """
+    pack = get_data_pack()
+    if pack is not None:
+        relpath = _relpath(path, DATA_DIR)
+        if relpath in pack:
+            return pack.load(relpath)
+
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compila data/ num data pack.")
+    parser.add_argument("--data-dir", default=DATA_DIR)
+    parser.add_argument("--check", action="store_true",
+                        help="só informa se o pack atual está válido")
+    args = parser.parse_args(argv)
+
+    if args.check:
+        pack = read_data_pack(args.data_dir)
+        if pack is None:
+            print("📦 Sem data pack válido")
+        else:
+            print(f"📦 Data pack válido: {len(pack.files)} arquivos, sha256 {pack.content_hash[:12]}")
+        return
+
+    path = build_data_pack(args.data_dir)
+    print(f"📦 Data pack gerado: {path} ({os.path.getsize(path) / 1024:.1f} KiB)")
+
+
+if __name__ == "__main__":
+    main()
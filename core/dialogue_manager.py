@@ -2,31 +2,28 @@
 import json
 import random
 import os
-from core.language_manager import LanguageManager
+from core.language_manager import get_language_manager
+from core.data_pack import load_json
+from core.quest_catalog import get_quest_catalog
 
 
 class DialogueManager:
     def __init__(self, language="en"):
         self.language = language
-        self.lm = LanguageManager()
+        self.lm = get_language_manager()
+        self.lm.add_listener(self.set_language)
         self.heroes_folder = "data/heroes/dialogues"
 
     def set_language(self, language):
         self.language = language
 
     def _load_quest_dialogue(self, quest_id: str) -> dict:
-        quest_id_formatted = str(quest_id).zfill(3)
-    
-        path = os.path.join("data/quests", f"{quest_id_formatted}.json")
-        if not os.path.exists(path):
-            print(f"[DialogueManager] Quest dialogue não encontrado: {path}")
-            return {}
-        try:
-            with open(path, "r", encoding="utf-8") as f:
-                return json.load(f)
-        except Exception as e:
-            print(f"[DialogueManager] Erro ao carregar quest {quest_id}: {e}")
+        # Mesmo catálogo das Quests: o arquivo é lido uma vez e a narrativa fica em cache
+        narrative = get_quest_catalog().get_narrative(quest_id)
+        if narrative is None:
+            print(f"[DialogueManager] Quest dialogue não encontrado: {quest_id}")
             return {}
+        return narrative
 
     def _load_hero_dialogue(self, hero_id: str) -> dict:
         path = os.path.join(self.heroes_folder, f"{hero_id}.json")
@@ -34,8 +31,7 @@ class DialogueManager:
             print(f"[DialogueManager] Arquivo de diálogos não encontrado: {path}")
             return {}
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                return json.load(f)
+            return load_json(path)
         except Exception as e:
             print(f"[DialogueManager] Erro ao carregar {path}: {e}")
             return {}
@@ -49,6 +45,11 @@ class DialogueManager:
                 resolved[key] = value
         return resolved
 
+    def _quest_rng(self, quest_id, phase: str, heroes: list) -> random.Random:
+        """RNG das falas: mesma quest, fase, idioma e party sorteiam as mesmas falas."""
+        party = ",".join(sorted(str(h.id) for h in heroes))
+        return random.Random(f"{quest_id}:{phase}:{self.language}:{party}")
+
     def _resolve_perk(self, heroes: list, context: dict) -> str | None:
         """Retorna o primeiro perk da party que esteja nos perks usados na quest."""
         used_perks = context.get("perks", [])
@@ -67,7 +68,8 @@ class DialogueManager:
         quest_id: str,
         result: str,
         quest_type: str = "fight",
-        context: dict | None = None
+        context: dict | None = None,
+        rng: random.Random | None = None
     ) -> list:
 
         quest_id  = str(quest_id)
@@ -79,6 +81,8 @@ class DialogueManager:
 
         if context is None:
             context = {}
+        if rng is None:
+            rng = self._quest_rng(quest_id, result, heroes)
 
         resolved_ctx = self._resolve_context(context)
 
@@ -124,7 +128,7 @@ class DialogueManager:
                           .get(self.language)
                 )
                 if isinstance(arrived_texts, list) and arrived_texts:
-                    parts.append(random.choice(arrived_texts).format(**resolved_ctx))
+                    parts.append(rng.choice(arrived_texts).format(**resolved_ctx))
 
             # ── ACTION: escolhido pelo tipo da quest ──────────────────
             action_texts = (
@@ -134,7 +138,7 @@ class DialogueManager:
                       .get(self.language)
             )
             if isinstance(action_texts, list) and action_texts:
-                parts.append(random.choice(action_texts).format(**resolved_ctx))
+                parts.append(rng.choice(action_texts).format(**resolved_ctx))
             else:
                 print(f"[DialogueManager] WARN: sem action '{quest_type}' para herói {hero_id}")
 
@@ -144,7 +148,7 @@ class DialogueManager:
 
                 # candidatos: todo mundo exceto o próprio herói
                 candidates = [h for h in ordered_heroes if h.id != hero.id]
-                random.shuffle(candidates)  # <- pulo do gato
+                rng.shuffle(candidates)  # <- pulo do gato
 
                 for other in candidates:
                     if other.id == hero.id:
@@ -155,7 +159,7 @@ class DialogueManager:
                                     .get(self.language)
                     )
                     if isinstance(other_texts, list) and other_texts:
-                        text = random.choice(other_texts).replace(
+                        text = rng.choice(other_texts).replace(
                             "{hero_name}", getattr(other, "name", f"hero_{other.id}")
                         )
                         parts.append(text.format(**resolved_ctx))
@@ -164,7 +168,7 @@ class DialogueManager:
             # ── CONCLUSION: apenas o último herói da party ────────────
             if index == len(ordered_heroes) - 1:
                 if isinstance(conclusion_texts, list) and conclusion_texts:
-                    parts.append(random.choice(conclusion_texts).format(**resolved_ctx))
+                    parts.append(rng.choice(conclusion_texts).format(**resolved_ctx))
 
             if parts:
                 falas.append({"id": hero_id, "text": " ".join(parts)})
@@ -174,9 +178,13 @@ class DialogueManager:
     # ─────────────────────────────────────────────────────────────────────
     # 🎯 DIÁLOGO INICIAL (início da quest)
     # ─────────────────────────────────────────────────────────────────────
-    def get_start_dialogue(self, heroes: list, relation_counters: dict = None) -> list:
+    def get_start_dialogue(self, heroes: list, relation_counters: dict = None,
+                           quest_id=None, rng: random.Random | None = None) -> list:
         if relation_counters is None:
             relation_counters = {}
+        if rng is None:
+            # Sem quest não há de onde derivar a seed: sorteio livre
+            rng = self._quest_rng(quest_id, "start", heroes) if quest_id is not None else random
 
         falas = []
 
@@ -201,14 +209,14 @@ class DialogueManager:
                 lang_block   = chains[other_key].get(str(counter), {})
                 chain_texts  = lang_block.get(self.language)
                 if isinstance(chain_texts, list) and chain_texts:
-                    chosen_text = random.choice(chain_texts)
+                    chosen_text = rng.choice(chain_texts)
                     break
 
             # Prioridade 2: texto padrão
             if not chosen_text:
                 default_texts = start_data.get("default", {}).get(self.language)
                 if isinstance(default_texts, list) and default_texts:
-                    chosen_text = random.choice(default_texts)
+                    chosen_text = rng.choice(default_texts)
 
             if chosen_text:
                 falas.append({"id": hero_id, "text": chosen_text})
@@ -1,19 +1,34 @@
-import json
+from math import isqrt
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
+
+from core.data_pack import load_json
+from core.language_manager import get_language_manager
+
+# Ordem fixa dos atributos em Hero.stat_values
+STAT_KEYS = ("strength", "dexterity", "intelligence", "wisdom")
 
 
 def get_level_from_xp(xp: int) -> int:
-    level = 1
-    need = 100
-    while xp >= need:
-        xp -= need
-        level += 1
-        need += 100
-    return level
+    """
+    Nível para um total de XP. Subir do nível n para n+1 custa 100·n, então
+    chegar ao nível k+1 custa 50·k·(k+1) — basta inverter o número triangular.
+    """
+    if xp <= 0:
+        return 1
+    q = int(xp // 50)
+    return (isqrt(4 * q + 1) - 1) // 2 + 1
 
 
 class Hero:
+    __slots__ = (
+        "id", "_language", "_name", "_last_name", "_role", "_hero_class", "_story",
+        "_perks", "_defects", "status_listener", "_status", "photo_url",
+        "photo_body_url", "unlock_by_quest", "available_from_turn",
+        "leave_on_quest", "growth_curve", "starter",
+        "_xp", "_level", "_stats", "_stat_values",
+    )
+
     def __init__(
         self,
         id: int,
@@ -33,24 +48,29 @@ class Hero:
         growth_curve: Dict[str, Dict[str, int]],
         starter: bool = False,
         xp: int = 0,
-        language: str = "en"
+        language: str | None = "en"
     ):
-        """Inicializa o herói já traduzindo com base no idioma."""
+        """
+        Inicializa o herói. Os campos multilíngues guardam o original e são
+        traduzidos na leitura; language=None segue o idioma ativo do
+        LanguageManager, então trocar de idioma não recria o herói.
+        """
         self.id = id
         self.language = language
 
         # Campos que podem ser multilíngues
-        self.name = self._get_lang_value(name)
-        self.last_name = self._get_lang_value(last_name)
-        self.role = self._get_lang_value(role)
-        self.hero_class = self._get_lang_value(hero_class)
-        self.story = self._get_lang_value(story)
+        self._name = name
+        self._last_name = last_name
+        self._role = role
+        self._hero_class = hero_class
+        self._story = story
 
-        self.perks = self._get_lang_list(perks)
-        self.defects = self._get_lang_list(defects)
+        self._perks = perks
+        self._defects = defects
 
         # Campos fixos
-        self.status = 'idle'
+        self.status_listener = None  # chamado como listener(hero, antigo, novo)
+        self._status = 'idle'
         self.photo_url = photo_url
         self.photo_body_url = photo_body_url
         self.unlock_by_quest = unlock_by_quest or []
@@ -58,8 +78,57 @@ class Hero:
         self.leave_on_quest = leave_on_quest or []
         self.growth_curve = growth_curve
         self.starter = starter
+        self._level = None        # cache do nível — zerado quando o XP muda
+        self._stats = None        # atributos do nível atual
+        self._stat_values = None  # mesmos atributos, como tupla na ordem de STAT_KEYS
         self.xp = xp
 
+    # -------------------- Textos --------------------
+
+    @property
+    def language(self) -> str:
+        if self._language is None:
+            return get_language_manager().language
+        return self._language
+
+    @language.setter
+    def language(self, value):
+        self._language = value
+
+    @property
+    def name(self):
+        return self._get_lang_value(self._name)
+
+    @property
+    def last_name(self):
+        return self._get_lang_value(self._last_name)
+
+    @property
+    def role(self):
+        return self._get_lang_value(self._role)
+
+    @property
+    def hero_class(self):
+        return self._get_lang_value(self._hero_class)
+
+    @property
+    def story(self):
+        return self._get_lang_value(self._story)
+
+    @property
+    def perks(self):
+        return self._get_lang_list(self._perks)
+
+    @property
+    def defects(self):
+        return self._get_lang_list(self._defects)
+
+    def name_variants(self) -> set:
+        """Nome em todos os idiomas disponíveis (para buscas que independem do idioma)."""
+        if isinstance(self._name, dict):
+            return {str(v) for v in self._name.values() if v}
+        return {str(self._name)}
+
     # -------------------- Métodos auxiliares --------------------
 
     def _get_lang_value(self, value):
@@ -76,13 +145,47 @@ class Hero:
 
     # -------------------- Métodos principais --------------------
 
+    @property
+    def status(self) -> str:
+        return self._status
+
+    @status.setter
+    def status(self, value: str) -> None:
+        old = self._status
+        self._status = value
+        if self.status_listener is not None and old != value:
+            self.status_listener(self, old, value)
+
+    @property
+    def xp(self) -> int:
+        return self._xp
+
+    @xp.setter
+    def xp(self, value: int) -> None:
+        self._xp = value
+        self._level = None
+        self._stats = None
+        self._stat_values = None
+
     @property
     def level(self) -> int:
-        return get_level_from_xp(self.xp)
+        if self._level is None:
+            self._level = get_level_from_xp(self._xp)
+        return self._level
 
     @property
     def stats(self) -> Dict[str, int]:
-        return self.growth_curve.get(str(self.level), {}) or {}
+        if self._stats is None:
+            self._stats = self.growth_curve.get(str(self.level), {}) or {}
+        return self._stats
+
+    @property
+    def stat_values(self) -> Tuple[int, ...]:
+        """Atributos do nível atual na ordem de STAT_KEYS (0 se faltar)."""
+        if self._stat_values is None:
+            stats = self.stats
+            self._stat_values = tuple(stats.get(key, 0) for key in STAT_KEYS)
+        return self._stat_values
 
     def get_attr(self, attr: str) -> int:
         return int(self.stats.get(attr, 0))
@@ -112,7 +215,7 @@ class Hero:
         Carrega todos os heróis da pasta especificada.
         
         Args:
-            language: Idioma para carregar (pt, en, es, etc)
+            language: Idioma dos heróis (pt, en, es, etc); None segue o idioma ativo
             heroes_folder: Pasta onde estão os arquivos JSON dos heróis
             
         Returns:
@@ -129,8 +232,7 @@ class Hero:
         # Busca todos os arquivos .json na pasta
         for json_file in sorted(folder_path.glob("*.json")):
             try:
-                with open(json_file, "r", encoding="utf-8") as f:
-                    hero_data = json.load(f)
+                hero_data = load_json(json_file)
                 
                 # Cria o herói com o idioma especificado
                 hero = Hero(language=language, **hero_data)
@@ -1,12 +1,14 @@
+from collections import defaultdict
+
 from core.hero import Hero
 
 
 class HeroManager:
-    def __init__(self, language="en"):
-        self.language = language  # ✅ armazenamos o idioma atual
+    def __init__(self, language=None):
+        self.language = language  # ✅ None = heróis seguem o idioma ativo do LanguageManager
 
-        # Carrega todos os heróis do idioma escolhido
-        self.all_heroes = Hero.load_heroes(language=self.language)
+        # Carrega todos os heróis (textos traduzidos na leitura)
+        self._index_heroes(Hero.load_heroes(language=self.language))
 
         # Conjunto de IDs desbloqueados
         self.unlocked_heroes = set()
@@ -39,11 +41,13 @@ class HeroManager:
                     self.unlocked_heroes.add(hero.id)
 
     def get_available_heroes(self) -> list[Hero]:
-        """Retorna os heróis desbloqueados e disponíveis (status = idle)."""
-        return [
-            h for h in self.all_heroes
-            if h.id in self.unlocked_heroes and h.status == "idle"
-        ]
+        """Retorna os heróis desbloqueados e disponíveis (status = idle), na ordem do elenco."""
+        ids = self._status_buckets["idle"] & self.unlocked_heroes
+        return [self._by_id[hid] for hid in sorted(ids, key=self._roster_order.__getitem__)]
+
+    def get_heroes_by_status(self, status: str) -> list[Hero]:
+        ids = self._status_buckets.get(status, ())
+        return [self._by_id[hid] for hid in sorted(ids, key=self._roster_order.__getitem__)]
 
     def is_hero_unlocked(self, hero_id: int) -> bool:
         """Verifica se um herói está desbloqueado."""
@@ -51,18 +55,14 @@ class HeroManager:
 
     def get_hero_by_id(self, hero_id: int) -> Hero | None:
         """Busca um herói pelo ID."""
-        for h in self.all_heroes:
-            if h.id == hero_id:
-                return h
-        return None
+        try:
+            return self._by_id.get(hero_id)
+        except TypeError:  # ID não hasheável
+            return None
 
     def get_hero_by_name(self, name: str) -> Hero | None:
-        """Busca um herói pelo nome (case insensitive)."""
-        name = name.strip().lower()
-        for h in self.all_heroes:
-            if h.name.strip().lower() == name:
-                return h
-        return None
+        """Busca um herói pelo nome em qualquer idioma (case insensitive)."""
+        return self._by_name.get(name.strip().casefold())
 
     def reset_heroes(self):
         """Reseta o progresso dos heróis (para novo jogo, por exemplo)."""
@@ -71,16 +71,42 @@ class HeroManager:
             hero.xp = 0
             hero.status = "idle"
 
-    def reload_language(self, new_language: str):
-        """Troca o idioma dos heróis em tempo real."""
+    def reload_language(self, new_language: str | None):
+        """
+        Fixa o idioma dos heróis deste manager (None volta a seguir o idioma
+        ativo). Não relê os JSON: XP, status e unlocks ficam como estão.
+        """
         self.language = new_language
-        self.all_heroes = Hero.load_heroes(language=new_language)
-        # ⚠️ Mantém progresso e unlocks já existentes, se desejar resetar, chame reset_heroes()
+        for hero in self.all_heroes:
+            hero.language = new_language
+
+    # -------------------- Índices --------------------
+
+    def _index_heroes(self, heroes: list[Hero]):
+        """Reconstrói os índices (ID, nome, status) para a lista de heróis dada."""
+        for hero in getattr(self, "all_heroes", ()):
+            hero.status_listener = None
+
+        self.all_heroes = heroes
+        self._by_id = {}
+        self._by_name = {}
+        self._roster_order = {}
+        self._status_buckets = defaultdict(set)  # {status: {hero_id}}
+
+        for position, hero in enumerate(heroes):
+            # Em IDs/nomes repetidos vale o primeiro, como na busca linear antiga
+            self._by_id.setdefault(hero.id, hero)
+            for name in hero.name_variants():
+                self._by_name.setdefault(name.strip().casefold(), hero)
+            self._roster_order.setdefault(hero.id, position)
+            self._status_buckets[hero.status].add(hero.id)
+            hero.status_listener = self._on_status_changed
 
-    def load_heroes(self, language: str = "en"):
-        from core.hero import Hero
-        self.language = language
-        self.heroes = Hero.load_heroes(language)
+    def _on_status_changed(self, hero: Hero, old: str, new: str):
+        bucket = self._status_buckets.get(old)
+        if bucket is not None:
+            bucket.discard(hero.id)
+        self._status_buckets[new].add(hero.id)
 
 if __name__ == "__main__":
     manager = HeroManager(language="en")
@@ -1,4 +1,7 @@
 import json
+import weakref
+
+from core.data_pack import load_json
 
 class LanguageManager:
     def __init__(self, lang_file="data/lang.json", config_file="config.json"):
@@ -7,9 +10,12 @@ class LanguageManager:
         self.translations = self._load_translations()
         self.language = self._load_language()
 
+        self._tables = {}     # {idioma: {chave: texto}} — montado no primeiro t()
+        self._reverse = {}    # {idioma: {texto: chave}} — montado no primeiro rt()
+        self._listeners = []  # callbacks(idioma) guardados por referência fraca
+
     def _load_translations(self):
-        with open(self.lang_file, "r", encoding="utf-8") as f:
-            return json.load(f)
+        return load_json(self.lang_file)
 
     def _load_language(self):
         try:
@@ -20,7 +26,10 @@ class LanguageManager:
             return "en"
 
     def set_language(self, lang_code: str):
-        """Muda o idioma e salva no config sem apagar os outros dados."""
+        """Muda o idioma, salva no config sem apagar os outros dados e avisa os listeners."""
+        if lang_code == self.language:
+            return
+
         self.language = lang_code
 
         try:
@@ -38,27 +47,88 @@ class LanguageManager:
         with open(self.config_file, "w", encoding="utf-8") as f:
             json.dump(config, f, ensure_ascii=False, indent=4)
 
+        self._notify(lang_code)
+
+    # ──────────────────────────────────────────────────────────────────────────
+    # Listeners
+    # ──────────────────────────────────────────────────────────────────────────
+
+    def add_listener(self, callback):
+        """
+        callback(idioma) é chamado a cada troca de idioma. Métodos ficam só com
+        referência fraca: objetos descartados (telas, DialogueManager) saem sozinhos.
+        """
+        if hasattr(callback, "__self__"):
+            ref = weakref.WeakMethod(callback)
+        else:
+            ref = lambda: callback
+        self._listeners.append(ref)
+
+    def remove_listener(self, callback):
+        self._listeners = [ref for ref in self._listeners if ref() not in (None, callback)]
+
+    def _notify(self, lang_code: str):
+        alive = []
+        for ref in self._listeners:
+            callback = ref()
+            if callback is None:
+                continue
+            alive.append(ref)
+            callback(lang_code)
+        self._listeners = alive
+
+    # ──────────────────────────────────────────────────────────────────────────
+    # Tradução
+    # ──────────────────────────────────────────────────────────────────────────
+
+    def _table(self, lang_code: str) -> dict:
+        table = self._tables.get(lang_code)
+        if table is None:
+            table = self._tables[lang_code] = {
+                key: langs[lang_code]
+                for key, langs in self.translations.items()
+                if langs.get(lang_code) is not None
+            }
+        return table
+
     def t(self, key: str) -> str:
         """Traduz uma chave interna (ex: 'strength' → 'Força')."""
-        entry = self.translations.get(key)
-        if entry is None:
+        text = self._table(self.language).get(key)
+        if text is not None:
+            return text
+
+        if key not in self.translations:
             print(f"[DEBUG] Chave não encontrada: {key}")
-            return key
-        text = entry.get(self.language)
-        if text is None:
+        else:
             print(f"[DEBUG] Tradução não encontrada para idioma '{self.language}' na chave '{key}'")
-            return key
-        return text
+        return key
 
     def rt(self, text: str) -> str:
         """Tradução reversa — obtém a chave interna a partir do texto traduzido."""
-        for key, langs in self.translations.items():
-            if langs.get(self.language) == text:
-                return key
-        return text  # se não encontrar, retorna o original
+        reverse = self._reverse.get(self.language)
+        if reverse is None:
+            reverse = self._reverse[self.language] = {}
+            for key, value in self._table(self.language).items():
+                if isinstance(value, str):
+                    reverse.setdefault(value, key)  # igual à busca linear: vale a primeira chave
+        return reverse.get(text, text)  # se não encontrar, retorna o original
+
+
+# ═══════════════════════════════════════════════════════════
+# SINGLETON GLOBAL
+# ═══════════════════════════════════════════════════════════
+
+_language_manager = None
+
+def get_language_manager():
+    """Retorna a instância global do LanguageManager (lang.json lido uma vez)."""
+    global _language_manager
+    if _language_manager is None:
+        _language_manager = LanguageManager()
+    return _language_manager
 
 if __name__ == "__main__":
-    lm = LanguageManager()
+    lm = get_language_manager()
 
     print("--- Tradução normal ---")
     print(lm.t("strength"))
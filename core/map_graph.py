@@ -1,5 +1,5 @@
-from typing import Dict, List, Optional, Tuple, Set
-from collections import deque
+from typing import Dict, FrozenSet, List, Optional, Tuple, Set
+from collections import deque, OrderedDict
 import heapq
 
 # Estrutura de MAP_EDGES Revisada
@@ -60,24 +60,30 @@ MAP_EDGES: List[Tuple[str, str, Optional[str], int]] = [
 
 class MapGraph:
     STARTING_LOCATION = "goldenreach_plains"
+    # Quantos conjuntos de pontes bloqueadas ficam em cache (LRU)
+    CACHE_SIZE = 8
 
     def __init__(self, bridges_data: Dict = None):
         self.blocked_bridges: Set[str] = set()
-        self._simulated_blocks: Set[str] = set()
         self.graph: Dict = self._build_graph()
         # Mapeia bridge_key para os dois nós que ela conecta
         self.bridge_endpoints: Dict[str, Tuple[str, str]] = self._map_bridges()
 
+        # Só pontes que existem no grafo entram na chave do cache
+        self._blocked_key: FrozenSet[str] = frozenset()
+        # {pontes bloqueadas: {"distances": ..., "reachable": ..., "cuts": ...}}
+        self._state_cache: "OrderedDict[FrozenSet[str], Dict]" = OrderedDict()
+
     def _build_graph(self) -> Dict:
         graph: Dict = {}
-        for origin, destination, bridge, distance in MAP_EDGES:
+        for edge_id, (origin, destination, bridge, distance) in enumerate(MAP_EDGES):
             graph.setdefault(origin, {"connections": []})
             graph.setdefault(destination, {"connections": []})
             graph[origin]["connections"].append(
-                {"destination": destination, "bridge": bridge, "distance": distance}
+                {"destination": destination, "bridge": bridge, "distance": distance, "edge": edge_id}
             )
             graph[destination]["connections"].append(
-                {"destination": origin, "bridge": bridge, "distance": distance}
+                {"destination": origin, "bridge": bridge, "distance": distance, "edge": edge_id}
             )
         return graph
 
@@ -91,16 +97,25 @@ class MapGraph:
     # ── Estado das arestas ────────────────────────────────────────────────────
 
     def block_bridge(self, bridge_key: str) -> List[str]:
-        self.blocked_bridges.add(bridge_key)
+        if bridge_key not in self.blocked_bridges:
+            self.blocked_bridges.add(bridge_key)
+            self._update_blocked_key()
         blocked_areas = self.get_locations_blocked_by(bridge_key)
         return blocked_areas
 
     def unblock_bridge(self, bridge_key: str) -> List[str]:
         previously_blocked = self.get_locations_blocked_by(bridge_key)
-        self.blocked_bridges.discard(bridge_key)
+        if bridge_key in self.blocked_bridges:
+            self.blocked_bridges.discard(bridge_key)
+            self._update_blocked_key()
         print(f"🔓 Desbloqueada: {bridge_key} → regiões reabertas: {previously_blocked or ['nenhuma']}")
         return previously_blocked
 
+    def _update_blocked_key(self) -> None:
+        self._blocked_key = frozenset(
+            key for key in self.blocked_bridges if key in self.bridge_endpoints
+        )
+
     def is_bridge_blocked(self, bridge_key: str) -> bool:
         return bridge_key in self.blocked_bridges
 
@@ -109,13 +124,13 @@ class MapGraph:
 
     # ── Travessia ─────────────────────────────────────────────────────────────
 
-    def _can_cross(self, conn: Dict, simulated: bool = False) -> bool:
+    def _can_cross(self, conn: Dict, blocked: Optional[FrozenSet[str]] = None) -> bool:
         key = conn.get("bridge")
         if key is None:
             return True
-        if simulated and key in self._simulated_blocks:
-            return False
-        return key not in self.blocked_bridges
+        if blocked is None:
+            blocked = self.blocked_bridges
+        return key not in blocked
 
     # ── Acessibilidade ────────────────────────────────────────────────────────
 
@@ -131,22 +146,7 @@ class MapGraph:
     def _check_node_accessibility(self, node: str) -> bool:
         if node == self.STARTING_LOCATION:
             return True
-        if node not in self.graph:
-            return False
-
-        visited = {self.STARTING_LOCATION}
-        queue = deque([self.STARTING_LOCATION])
-        while queue:
-            current = queue.popleft()
-            for conn in self.graph.get(current, {}).get("connections", []):
-                dest = conn["destination"]
-                if not self._can_cross(conn) or dest in visited:
-                    continue
-                if dest == node:
-                    return True
-                visited.add(dest)
-                queue.append(dest)
-        return False
+        return node in self._get_reachable()
 
     def get_blocking_bridge(self, target: str) -> Optional[str]:
         if target == self.STARTING_LOCATION or self.is_location_accessible(target):
@@ -195,85 +195,164 @@ class MapGraph:
         """
         if target == self.STARTING_LOCATION:
             return 0
-            
-        # Dijkstra para encontrar o caminho mais curto respeitando bloqueios
-        distances = {self.STARTING_LOCATION: 0}
-        pq = [(0, self.STARTING_LOCATION)]
-        
-        target_nodes = {target}
+
+        distances = self._get_distance_table()
+
+        target_nodes = (target,)
         if target in self.bridge_endpoints:
-            target_nodes = set(self.bridge_endpoints[target])
+            target_nodes = self.bridge_endpoints[target]
 
-        min_dist_to_target = float('inf')
+        reachable = [distances[node] for node in target_nodes if node in distances]
+
+        # Retorna -1 se o alvo for inalcançável (não 0, para não confundir com o ponto de partida)
+        return min(reachable) if reachable else -1
+
+    def _get_distance_table(self) -> Dict[str, int]:
+        """Distâncias a partir do início para o conjunto atual de pontes bloqueadas."""
+        return self._get_cached("distances", self._compute_distances)
+
+    def _get_cached(self, name: str, compute):
+        """Resultado memoizado por conjunto de pontes bloqueadas (LRU de CACHE_SIZE estados)."""
+        key = self._blocked_key
+        state = self._state_cache.get(key)
+
+        if state is None:
+            state = {}
+            self._state_cache[key] = state
+            if len(self._state_cache) > self.CACHE_SIZE:
+                self._state_cache.popitem(last=False)
+        else:
+            self._state_cache.move_to_end(key)
+
+        if name not in state:
+            state[name] = compute()
+        return state[name]
+
+    def _compute_distances(self) -> Dict[str, int]:
+        # Dijkstra a partir do início, respeitando bloqueios, para todos os nós
+        distances = {self.STARTING_LOCATION: 0}
+        pq = [(0, self.STARTING_LOCATION)]
 
         while pq:
             d, u = heapq.heappop(pq)
-            
+
             if d > distances.get(u, float('inf')):
                 continue
-                
-            if u in target_nodes:
-                min_dist_to_target = min(min_dist_to_target, d)
-                # Não paramos aqui porque pode haver um caminho mais curto para outro nó do target
-            
+
             for conn in self.graph.get(u, {}).get("connections", []):
                 v = conn["destination"]
                 if not self._can_cross(conn):
                     continue
-                    
+
                 weight = conn.get("distance", 1)
                 if d + weight < distances.get(v, float('inf')):
                     distances[v] = d + weight
                     heapq.heappush(pq, (distances[v], v))
-        
-        # Retorna -1 se o alvo for inalcançável (não 0, para não confundir com o ponto de partida)
-        return int(min_dist_to_target) if min_dist_to_target != float('inf') else -1
-   
+
+        return distances
+
     # ── Impacto de bloqueio ───────────────────────────────────────────────────
 
     def get_locations_blocked_by(self, edge_key: str) -> List[str]:
-        if not edge_key:
+        if not edge_key or edge_key in self.blocked_bridges:
             return []
 
-        # Estado antes do bloqueio
-        currently_accessible = set(self.get_accessible_locations())
-        
-        # Simula o bloqueio
-        self._simulated_blocks.add(edge_key)
-        accessible_without = set(self._get_accessible_simulated())
-        self._simulated_blocks.discard(edge_key)
+        # Áreas que são acessíveis hoje e deixariam de ser com o bloqueio
+        cut_off = self._get_cached("cuts", self._compute_bridge_cuts)
+        return sorted(cut_off.get(edge_key, ()))
 
-        # Áreas que eram acessíveis e deixaram de ser
-        return sorted(list(currently_accessible - accessible_without))
+    def _get_reachable(self) -> FrozenSet[str]:
+        return self._get_cached("reachable", lambda: self._compute_reachable(self._blocked_key))
 
-    def _get_accessible_simulated(self) -> List[str]:
+    def _compute_reachable(self, blocked: FrozenSet[str]) -> FrozenSet[str]:
+        # Uma única BFS a partir do início
         accessible = {self.STARTING_LOCATION}
         queue = deque([self.STARTING_LOCATION])
         while queue:
             current = queue.popleft()
             for conn in self.graph.get(current, {}).get("connections", []):
                 dest = conn["destination"]
-                if dest in accessible or not self._can_cross(conn, simulated=True):
+                if dest in accessible or not self._can_cross(conn, blocked):
                     continue
                 accessible.add(dest)
                 queue.append(dest)
-        return list(accessible)
+        return frozenset(accessible)
+
+    def _compute_bridge_cuts(self) -> Dict[str, FrozenSet[str]]:
+        """
+        Para cada ponte aberta, quais nós acessíveis ficariam isolados se ela fosse bloqueada.
+
+        Uma única DFS (Tarjan) sobre a parte acessível do mapa encontra as arestas
+        de corte; a região isolada por uma delas é a subárvore abaixo dela.
+        """
+        start = self.STARTING_LOCATION
+        blocked = self._blocked_key
+
+        order: Dict[str, int] = {}
+        low: Dict[str, int] = {}
+        cut_edges: Dict[int, FrozenSet[str]] = {}  # {edge_id: região isolada}
+        visit: List[str] = []
+
+        # DFS iterativa: (nó, aresta de chegada, iterador das conexões)
+        order[start] = low[start] = 0
+        visit.append(start)
+        stack = [(start, None, iter(self.graph.get(start, {}).get("connections", [])))]
+
+        while stack:
+            node, via_edge, connections = stack[-1]
+            advanced = False
+
+            for conn in connections:
+                if conn["edge"] == via_edge or not self._can_cross(conn, blocked):
+                    continue
+                dest = conn["destination"]
+                if dest in order:
+                    low[node] = min(low[node], order[dest])
+                    continue
+                order[dest] = low[dest] = len(order)
+                visit.append(dest)
+                stack.append((dest, conn["edge"], iter(self.graph.get(dest, {}).get("connections", []))))
+                advanced = True
+                break
+
+            if advanced:
+                continue
+
+            stack.pop()
+            if stack:
+                parent = stack[-1][0]
+                low[parent] = min(low[parent], low[node])
+                if low[node] > order[parent]:
+                    # Tudo visitado depois do nó é a subárvore dele
+                    cut_edges[via_edge] = frozenset(visit[order[node]:])
+
+        # Quantas arestas cada ponte rotula (uma ponte pode cobrir mais de uma)
+        edges_by_bridge: Dict[str, List[int]] = {}
+        for edge_id, (_, _, bridge, _) in enumerate(MAP_EDGES):
+            if bridge and bridge not in blocked:
+                edges_by_bridge.setdefault(bridge, []).append(edge_id)
+
+        reachable = frozenset(order)
+        cuts: Dict[str, FrozenSet[str]] = {}
+        for bridge, edge_ids in edges_by_bridge.items():
+            if len(edge_ids) == 1:
+                cuts[bridge] = cut_edges.get(edge_ids[0], frozenset())
+            else:
+                cuts[bridge] = reachable - self._compute_reachable(blocked | {bridge})
+
+        return cuts
 
     # ── Utilitários ───────────────────────────────────────────────────────────
 
     def get_accessible_locations(self) -> List[str]:
-        # Retorna todos os nós e pontes acessíveis
-        accessible = []
-        # Checa nós
-        for loc in self.graph:
-            if self._check_node_accessibility(loc):
-                accessible.append(loc)
-        return accessible
+        # Retorna todos os nós acessíveis (na ordem do grafo)
+        reachable = self._get_reachable()
+        return [loc for loc in self.graph if loc in reachable]
 
     def get_next_bridges(self) -> List[Dict]:
         next_bridges = []
         seen = set()
-        accessible_nodes = set(self.get_accessible_locations())
+        accessible_nodes = self._get_reachable()
         
         for bridge, (node_a, node_b) in self.bridge_endpoints.items():
             if not self.is_bridge_blocked(bridge):
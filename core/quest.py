@@ -1,9 +1,65 @@
-import json
-from pathlib import Path
-from typing import List, Dict, Optional
+import sys
+from typing import List, Dict, Optional, FrozenSet, Iterable, Tuple
+
+from core.language_manager import get_language_manager
+from core.quest_catalog import get_quest_catalog
+
+
+# Compartilhado por todas as quests sem requisitos (frozensets vazios não são únicos)
+EMPTY_IDS: FrozenSet[int] = frozenset()
+
+
+def compile_required_quests(required_quests) -> Tuple[FrozenSet[int], ...]:
+    """
+    Compila required_quests para a forma normalizada usada nas checagens.
+
+    Cada entrada vira um conjunto de IDs que precisam estar TODOS completos
+    ("10_12_15" → {10, 12, 15}); basta UMA entrada satisfeita para liberar.
+    """
+    clauses = []
+    for req in required_quests or []:
+        req_str = str(req).strip()
+        clauses.append(frozenset(int(qid) for qid in req_str.split("_")))
+    return tuple(clauses)
+
+
+def compile_quest_ids(quest_ids: Iterable) -> FrozenSet[int]:
+    """Normaliza uma lista de IDs (int ou str) para um frozenset de ints."""
+    ids = frozenset(int(qid) for qid in quest_ids or [])
+    return ids if ids else EMPTY_IDS
+
+
+# Chaves do context repetidas em milhares de quests procedurais
+INTERNED_CONTEXT_KEYS = ("location_key", "sub_location_key", "location_type")
+
+
+def intern_quest_type(quest_type):
+    if isinstance(quest_type, str):
+        return sys.intern(quest_type)
+    if isinstance(quest_type, list):
+        return [sys.intern(t) if isinstance(t, str) else t for t in quest_type]
+    return quest_type
 
 
 class Quest:
+    # Sem __dict__ por instância: o registro chega a milhares de quests
+    __slots__ = (
+        "id", "_language", "_name", "_description", "type", "max_heroes",
+        "expired_at", "available_from_turn", "duration", "difficulty", "rewards",
+        "required_quests", "forbidden_quests", "required_fail_quests",
+        "return_on_fail", "is_repeatable", "required_perks", "forbidden_heroes",
+        "available_since_turn", "remaining_turns", "_conclusion", "_context",
+        # requisitos compilados (compile_requirements)
+        "required_clauses", "required_ids", "forbidden_ids", "trigger_ids",
+        "prerequisite_ids",
+        # opcionais, lidos com getattr
+        "trigger_on_fail", "min_level",
+        # origem (QuestManager / ProceduralQuestSystem)
+        "origin", "is_procedural", "seed",
+        # procedurais: partes decodificadas da seed + quem renderiza os textos
+        "seed_parts", "text_source",
+    )
+
     def __init__(
         self,
         id: str,
@@ -24,18 +80,28 @@ class Quest:
         required_perks: List[str] = None,
         forbidden_heroes: List[str] = None,
         available_since_turn=None,
-        language: str = "en",
+        language: str | None = "en",
         context: dict | None = None,
         conclusion: dict | None = None,
+        seed_parts=None,
+        text_source=None,
     ):
         self.id = id
+        # None = segue o idioma ativo do LanguageManager (trocar de idioma não
+        # mexe nas quests); um código fixa o idioma desta quest
         self.language = language
 
-        # 🔹 Traduz automaticamente name e description se forem dicionários
-        self.name = self._get_lang_value(name)
-        self.description = self._get_lang_value(description)
+        # Com text_source, textos não informados (None) são renderizados sob
+        # demanda no idioma atual — ver ProceduralQuestSystem.render_quest_text
+        self.seed_parts = seed_parts
+        self.text_source = text_source
 
-        self.type = type or []
+        # 🔹 name e description guardam o original ({idioma: texto} ou str);
+        # a tradução é escolhida na leitura
+        self.name = name
+        self.description = description
+
+        self.type = intern_quest_type(type or [])
         self.max_heroes = max_heroes
         self.expired_at = expired_at
         self.available_from_turn = available_from_turn
@@ -52,11 +118,76 @@ class Quest:
         self.available_since_turn = available_since_turn
 
         self.remaining_turns = None
-        self.conclusion = conclusion or {}
-        self.context = context or {}
+        self.conclusion = conclusion if text_source else conclusion or {}
+        self.context = context if text_source else context or {}
+
+        self.compile_requirements()
+
+    # -------------------- Textos --------------------
+
+    @property
+    def language(self) -> str:
+        if self._language is None:
+            return get_language_manager().language
+        return self._language
+
+    @language.setter
+    def language(self, value):
+        self._language = value
+
+    def _text(self, part: str, value):
+        if value is None and self.text_source is not None:
+            return self.text_source.render_quest_text(self, part)
+        return value
+
+    @property
+    def name(self):
+        return self._get_lang_value(self._text("name", self._name))
+
+    @name.setter
+    def name(self, value):
+        self._name = value
+
+    @property
+    def description(self):
+        return self._get_lang_value(self._text("description", self._description))
+
+    @description.setter
+    def description(self, value):
+        self._description = value
+
+    @property
+    def conclusion(self):
+        return self._text("conclusion", self._conclusion)
+
+    @conclusion.setter
+    def conclusion(self, value):
+        self._conclusion = value
+
+    @property
+    def context(self):
+        return self._text("context", self._context)
+
+    @context.setter
+    def context(self, value):
+        if value:
+            for key in INTERNED_CONTEXT_KEYS:
+                if isinstance(value.get(key), str):
+                    value[key] = sys.intern(value[key])
+        self._context = value
 
     # -------------------- Métodos auxiliares --------------------
 
+    def compile_requirements(self) -> None:
+        """Pré-processa os requisitos uma única vez (sem parsing a cada checagem)."""
+        self.required_clauses = compile_required_quests(self.required_quests)
+        self.required_ids = EMPTY_IDS.union(*self.required_clauses) or EMPTY_IDS
+        self.forbidden_ids = compile_quest_ids(self.forbidden_quests)
+        self.trigger_ids = compile_quest_ids(getattr(self, "trigger_on_fail", None))
+
+        # Quests cuja resolução pode mudar a disponibilidade desta
+        self.prerequisite_ids = (self.required_ids | self.forbidden_ids | self.trigger_ids) or EMPTY_IDS
+
     def _get_lang_value(self, value):
         """Retorna o texto no idioma atual (ou o original se for string)."""
         if isinstance(value, dict):
@@ -105,28 +236,20 @@ class Quest:
     # 🔹 Carrega quests de acordo com o idioma
     @staticmethod
     def load_quests(language="en", quests_folder="data/quests") -> List["Quest"]:
-        folder_path = Path(quests_folder)
-        
-        if not folder_path.exists():
-            print(f"⚠️ Pasta '{quests_folder}' não encontrada!")
-            return []
-        
+        # Cabeçalhos lidos uma vez por processo; a conclusão vem sob demanda do catálogo.
+        # language=None: as quests seguem o idioma ativo do LanguageManager
+        catalog = get_quest_catalog(quests_folder)
         quests = []
-        
-        # Busca todos os arquivos .json na pasta
-        for json_file in sorted(folder_path.glob("*.json")):
+
+        for header in catalog.headers():
             try:
-                with open(json_file, "r", encoding="utf-8") as f:
-                    hero_data = json.load(f)
-                
-                # Cria o herói com o idioma especificado
-                quest = Quest(language=language, **hero_data)
+                quest = Quest(language=language, text_source=catalog, **header)
                 quests.append(quest)
-                
+
             except Exception as e:
-                print(f"❌ Erro ao carregar '{json_file.name}': {e}")
+                print(f"❌ Erro ao carregar quest '{header.get('id')}': {e}")
                 continue
-        
+
         return quests
 
     @staticmethod
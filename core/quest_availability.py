@@ -0,0 +1,165 @@
+from collections import defaultdict
+
+
+class QuestAvailability:
+    """
+    Mantém o conjunto de quests disponíveis de forma incremental.
+
+    Em vez de varrer o quest_registry inteiro a cada chamada, guarda quais
+    quests estão pendentes/disponíveis e só reavalia as que tiveram algum
+    insumo alterado (conclusão, falha, ativação ou mudança de turno).
+    """
+
+    def __init__(self, manager):
+        self.manager = manager
+
+        self._order = {}        # {quest_id: ordem de registro} — mantém a ordem do registro
+        self._next_order = 0
+
+        self._pending = set()    # registradas, ainda não resolvidas
+        self._available = set()  # passaram em todas as checagens
+        self._dirty = set()      # precisam ser reavaliadas no próximo refresh
+
+        self._dependents = defaultdict(set)  # {quest_id: {quests que dependem dela}}
+        self._prerequisites = {}             # {quest_id: frozenset de pré-requisitos}
+        self._volatile = set()   # dependem do estado dos heróis (min_level)
+
+        self._unlock_schedule = defaultdict(set)  # {turno: {quest_id}}
+        self._last_turn = None
+
+    # ──────────────────────────────────────────────────────────────────────────
+    # Registro
+    # ──────────────────────────────────────────────────────────────────────────
+
+    def track(self, quest):
+        """Passa a acompanhar uma quest recém-registrada."""
+        qid = quest.id
+
+        if qid not in self._order:
+            self._order[qid] = self._next_order
+            self._next_order += 1
+
+        self._unlink_prerequisites(qid)
+        prerequisites = getattr(quest, "prerequisite_ids", frozenset())
+        for prerequisite_id in prerequisites:
+            self._dependents[prerequisite_id].add(qid)
+        self._prerequisites[qid] = prerequisites
+
+        if getattr(quest, "min_level", None):
+            self._volatile.add(qid)
+        else:
+            self._volatile.discard(qid)
+
+        available_from_turn = getattr(quest, "available_from_turn", None)
+        if available_from_turn is not None and available_from_turn > self.manager.current_turn:
+            self._unlock_schedule[available_from_turn].add(qid)
+
+        if not self._is_resolved(qid):
+            self._pending.add(qid)
+        self._dirty.add(qid)
+
+    def untrack(self, quest_id):
+        """Deixa de acompanhar uma quest (ex.: removida do registro)."""
+        self._pending.discard(quest_id)
+        self._available.discard(quest_id)
+        self._dirty.discard(quest_id)
+        self._unlink_prerequisites(quest_id)
+        self._volatile.discard(quest_id)
+        self._order.pop(quest_id, None)
+
+    def invalidate(self):
+        """Descarta todo o estado e reavalia o registro inteiro no próximo refresh."""
+        self._pending.clear()
+        self._available.clear()
+        self._dirty.clear()
+        self._dependents.clear()
+        self._prerequisites.clear()
+        self._volatile.clear()
+        self._unlock_schedule.clear()
+        self._last_turn = None
+
+        for quest in self.manager.quest_registry.values():
+            self.track(quest)
+
+    # ──────────────────────────────────────────────────────────────────────────
+    # Eventos
+    # ──────────────────────────────────────────────────────────────────────────
+
+    def mark_dirty(self, quest_id):
+        self._dirty.add(quest_id)
+
+    def on_quest_resolved(self, quest_id):
+        """Quest concluída, falhada ou expirada: reavalia ela e só as quests que dependem dela."""
+        self._dirty.add(quest_id)
+        self._dirty |= self._dependents.get(quest_id, set())
+
+    # ──────────────────────────────────────────────────────────────────────────
+    # Consulta
+    # ──────────────────────────────────────────────────────────────────────────
+
+    def pending_quests(self) -> list:
+        """Quests registradas que ainda não foram concluídas nem falharam."""
+        registry = self.manager.quest_registry
+        ordered = sorted(self._pending, key=self._order.__getitem__)
+        return [registry[qid] for qid in ordered if qid in registry]
+
+    def refresh(self) -> list:
+        """Reavalia apenas as quests sujas e retorna as disponíveis, na ordem do registro."""
+        current_turn = self.manager.current_turn
+
+        if self._last_turn is None or current_turn < self._last_turn:
+            # Primeira chamada ou turno voltou (load/reset): reavalia tudo
+            self._dirty |= self._pending
+        elif current_turn > self._last_turn:
+            for turn in [t for t in self._unlock_schedule if t <= current_turn]:
+                self._dirty |= self._unlock_schedule.pop(turn)
+
+        self._last_turn = current_turn
+        self._dirty |= self._volatile & self._pending
+
+        for qid in self._dirty:
+            self._evaluate(qid)
+        self._dirty.clear()
+
+        registry = self.manager.quest_registry
+        ordered = sorted(self._available, key=self._order.__getitem__)
+        return [registry[qid] for qid in ordered]
+
+    # ──────────────────────────────────────────────────────────────────────────
+    # Internos
+    # ──────────────────────────────────────────────────────────────────────────
+
+    def _is_resolved(self, quest_id) -> bool:
+        manager = self.manager
+        return (quest_id in manager.completed_quests or
+                quest_id in manager.failed_quests)
+
+    def _unlink_prerequisites(self, quest_id):
+        for prerequisite_id in self._prerequisites.pop(quest_id, ()):
+            dependents = self._dependents.get(prerequisite_id)
+            if dependents is not None:
+                dependents.discard(quest_id)
+                if not dependents:
+                    del self._dependents[prerequisite_id]
+
+    def _evaluate(self, quest_id):
+        manager = self.manager
+        quest = manager.quest_registry.get(quest_id)
+
+        if quest is None or self._is_resolved(quest_id):
+            self._pending.discard(quest_id)
+            self._available.discard(quest_id)
+            return
+
+        self._pending.add(quest_id)
+
+        if quest_id in manager.active_quests:
+            self._available.discard(quest_id)
+            return
+
+        manager._handle_quest_map_impact(quest)
+
+        if all(check(quest, manager) for check in manager.requirement_checks):
+            self._available.add(quest_id)
+        else:
+            self._available.discard(quest_id)
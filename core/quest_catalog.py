@@ -0,0 +1,138 @@
+# ════════════════════════════════════════════════════════════════
+# 📚 QUEST_CATALOG.PY - CATÁLOGO DAS QUESTS FIXAS
+# ════════════════════════════════════════════════════════════════
+#
+# O índice lê cada arquivo de data/quests uma vez por processo e guarda
+# só o cabeçalho (id, nome, descrição, requisitos, turnos, dificuldade,
+# tipo, context). Os blocos narrativos pesados (NARRATIVE_KEYS — a
+# conclusão em todos os idiomas) são descartados nessa passada: quando
+# alguém pede a narrativa de uma quest, aquele arquivo é lido uma
+# segunda vez e o resultado fica em cache. Assim a memória só paga pelas
+# conclusões realmente usadas.
+#
+# Quest.load_quests e o DialogueManager usam o mesmo catálogo, então
+# trocar de idioma, começar um jogo novo ou resolver uma quest não
+# reabre os arquivos.
+#
+# ════════════════════════════════════════════════════════════════
+
+from pathlib import Path
+
+from core.data_pack import load_json
+
+NARRATIVE_KEYS = ("conclusion",)
+
+
+class QuestCatalog:
+    def __init__(self, quests_folder: str = "data/quests"):
+        self.folder = Path(quests_folder)
+        self._headers = None   # [dict] na ordem dos arquivos
+        self._by_id = {}       # {quest_id: cabeçalho}
+        self._paths = {}       # {quest_id: Path}
+        self._narratives = {}  # {quest_id: {"conclusion": ...}}
+
+    # ──────────────────────────────────────────────────────────────────────────
+    # Índice
+    # ──────────────────────────────────────────────────────────────────────────
+
+    def _build_index(self):
+        self._headers = []
+        self._by_id = {}
+        self._paths = {}
+
+        if not self.folder.exists():
+            print(f"⚠️ Pasta '{self.folder}' não encontrada!")
+            return
+
+        for json_file in sorted(self.folder.glob("*.json")):
+            try:
+                data = load_json(json_file)
+            except Exception as e:
+                print(f"❌ Erro ao carregar '{json_file.name}': {e}")
+                continue
+
+            for key in NARRATIVE_KEYS:
+                data.pop(key, None)
+
+            self._headers.append(data)
+            # IDs repetidos: vale o primeiro arquivo, como na busca linear antiga
+            self._by_id.setdefault(data.get("id"), data)
+            self._paths.setdefault(data.get("id"), json_file)
+
+    def headers(self) -> list:
+        """Cabeçalhos de todas as quests, na ordem dos arquivos. Não modifique."""
+        if self._headers is None:
+            self._build_index()
+        return self._headers
+
+    def get_header(self, quest_id):
+        self.headers()
+        try:
+            return self._by_id.get(self._normalize_id(quest_id))
+        except TypeError:  # ID não hasheável
+            return None
+
+    def reload(self):
+        """Descarta índice e narrativas (ex.: depois de editar os JSONs)."""
+        self._headers = None
+        self._by_id = {}
+        self._paths = {}
+        self._narratives = {}
+
+    # ──────────────────────────────────────────────────────────────────────────
+    # Narrativa (carregada sob demanda)
+    # ──────────────────────────────────────────────────────────────────────────
+
+    def get_narrative(self, quest_id) -> dict | None:
+        """
+        Blocos narrativos da quest ({"conclusion": ...}) ou None se ela não
+        existe. Na primeira vez relê o arquivo da quest; depois vem do cache.
+        """
+        quest_id = self._normalize_id(quest_id)
+
+        narrative = self._narratives.get(quest_id)
+        if narrative is not None:
+            return narrative
+
+        self.headers()
+        path = self._paths.get(quest_id)
+        if path is None:
+            return None
+
+        try:
+            data = load_json(path)
+        except Exception as e:
+            print(f"❌ Erro ao carregar '{path.name}': {e}")
+            return None
+
+        narrative = {key: data[key] for key in NARRATIVE_KEYS if key in data}
+        self._narratives[quest_id] = narrative
+        return narrative
+
+    def render_quest_text(self, quest, part: str):
+        """text_source das quests fixas: só a conclusão é carregada sob demanda."""
+        narrative = self.get_narrative(quest.id) or {}
+        value = narrative.get(part)
+        if value is not None:
+            return value
+        return {} if part in ("conclusion", "context") else ""
+
+    @staticmethod
+    def _normalize_id(quest_id):
+        if isinstance(quest_id, str) and quest_id.isdigit():
+            return int(quest_id)
+        return quest_id
+
+
+# ═══════════════════════════════════════════════════════════
+# SINGLETON GLOBAL
+# ═══════════════════════════════════════════════════════════
+
+_quest_catalogs = {}
+
+def get_quest_catalog(quests_folder: str = "data/quests"):
+    """Retorna o catálogo compartilhado da pasta de quests."""
+    catalog = _quest_catalogs.get(quests_folder)
+    if catalog is None:
+        catalog = _quest_catalogs[quests_folder] = QuestCatalog(quests_folder)
+    return catalog
@@ -1,9 +1,15 @@
 import json
 import random
+import sys
+from bisect import bisect_left, bisect_right
+from itertools import accumulate
 from pathlib import Path
-from typing import Dict, List, Literal, Optional, TypedDict
+from collections import OrderedDict
+from typing import Container, Dict, Iterator, List, Literal, NamedTuple, Optional, TypedDict
 
-from core.quest import Quest
+from core.data_pack import load_json
+from core.language_manager import get_language_manager
+from core.quest import INTERNED_CONTEXT_KEYS, Quest
 from core.map_graph import MapGraph
 
 QuestType = Literal[
@@ -44,12 +50,69 @@ class QuestData(TypedDict, total=False):
     is_procedural: bool
 
 
+class SeedParts(NamedTuple):
+    """Dados que a seed referencia — o suficiente para renderizar os textos da quest."""
+    quest_type: str
+    verb: Dict
+    subject: Dict
+    location: Dict
+    sub_location: Dict
+    modifier: Dict
+
+
+class _WeightedSampler:
+    """
+    Escolha ponderada pré-compilada: pesos acumulados + busca binária.
+
+    Cada pick() consome exatamente um random.uniform(0, total) do RNG global
+    e devolve o primeiro item cujo peso acumulado alcança o sorteio, então
+    as mesmas seeds do RNG continuam gerando as mesmas quests.
+    """
+
+    __slots__ = ("items", "cumulative", "total")
+
+    def __init__(self, weighted_items):
+        weighted_items = list(weighted_items)
+        self.items = tuple(item for item, _ in weighted_items)
+        self.cumulative = list(accumulate(weight for _, weight in weighted_items))
+        self.total = self.cumulative[-1] if self.cumulative else 0
+
+    def __bool__(self) -> bool:
+        return bool(self.items)
+
+    def pick(self):
+        roll = random.uniform(0, self.total)
+        index = bisect_left(self.cumulative, roll)
+        return self.items[min(index, len(self.items) - 1)]
+
+
 class ProceduralQuestSystem:
 
     SUPPORTED_LANGUAGES = {"pt", "en", "es", "zh", "ja", "ru"}
 
-    def __init__(self, language: str = "pt", data_file: str = "data/quest_data.json"):
-        self.language = language if language in self.SUPPORTED_LANGUAGES else "pt"
+    EXPIRED_AT_RANGE = (3, 7)
+    DURATION_RANGE = (2, 5)
+    MAX_SEED_ATTEMPTS = 100  # sorteios repetidos seguidos antes de desistir de uma seed
+    TEXT_CACHE_SIZE = 1024   # pares (seed, idioma) com textos renderizados
+
+    CONCLUSION_TEMPLATES = {
+        "pt": {
+            "success": "A operação contra {subject} {modifier} {location} foi concluída com sucesso.",
+            "failure": "A missão envolvendo {subject} {modifier} {location} falhou.",
+        },
+        "en": {
+            "success": "The operation against the {modifier} {subject} {location} was completed successfully.",
+            "failure": "The mission involving the {modifier} {subject} {location} has failed.",
+        },
+        "es": {
+            "success": "La operación contra {subject} {modifier} {location} fue completada con éxito.",
+            "failure": "La misión relacionada con {subject} {modifier} {location} ha fracasado.",
+        },
+    }
+
+    def __init__(self, language: Optional[str] = "pt", data_file: str = "data/quest_data.json"):
+        # None = segue o idioma ativo do LanguageManager, assim como as quests geradas
+        self.language = language
         self.data_file = Path(data_file)
 
         self.actions: Dict = {}
@@ -74,6 +137,18 @@ class ProceduralQuestSystem:
         self.sub_location_by_id: Dict = {}
         self.modifier_by_id: Dict = {}
 
+        # Amostradores pré-compilados (ver _build_samplers)
+        self._verb_keys: Dict = {}
+        self._level_breakpoints: List[int] = []
+        self._subject_samplers: Dict = {}
+        self._sub_location_tables: Dict = {}
+        self._modifier_samplers: Dict = {}
+        self._none_modifier: Optional[Dict] = None
+        self._max_heroes_sampler = _WeightedSampler([])
+
+        # {(seed, idioma): {parte: texto}} — LRU de render_quest_text
+        self._text_cache: OrderedDict = OrderedDict()
+
         self.seeds = {
             "available": set(),
             "active": {},
@@ -83,6 +158,17 @@ class ProceduralQuestSystem:
         self._load_data()
         self._build_indexes()
 
+    @property
+    def language(self) -> str:
+        if self._language is None:
+            lang = get_language_manager().language
+            return lang if lang in self.SUPPORTED_LANGUAGES else "pt"
+        return self._language
+
+    @language.setter
+    def language(self, value: Optional[str]):
+        self._language = value if value is None or value in self.SUPPORTED_LANGUAGES else "pt"
+
 
     # ============================================================
     # LOAD / INDEX
@@ -90,8 +176,7 @@ class ProceduralQuestSystem:
 
     def _load_data(self) -> None:
         try:
-            with self.data_file.open("r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = load_json(self.data_file)
 
             self.actions = data.get("actions", {})
             self.subjects = data.get("subjects", {})
@@ -269,15 +354,109 @@ class ProceduralQuestSystem:
             for _, data in self.modifiers.items()
         }
 
+        self._build_samplers()
+
+    def _build_samplers(self) -> None:
+        """
+        Pré-computa os candidatos e pesos acumulados de cada sorteio.
+
+        - verbos: tupla de chaves por tipo
+        - subjects: por (tipo, faixa de nível) — a faixa muda só nos
+          min_level e max_level + 1 dos subjects
+        - sub-locations: por subject
+        - modifiers: por categoria do subject
+        """
+        self._verb_keys = {
+            action_key: tuple(action_data.get("verbs", {}))
+            for action_key, action_data in self.actions.items()
+        }
+
+        subject_entries = []
+        for key, subject in self.subjects.items():
+            entry = dict(subject)
+            entry["key"] = key
+            subject_entries.append(entry)
+
+        breakpoints = set()
+        for subject in subject_entries:
+            breakpoints.add(subject.get("min_level", 1))
+            breakpoints.add(subject.get("max_level", 99) + 1)
+        self._level_breakpoints = sorted(breakpoints)
+
+        # Um nível representante por faixa: abaixo do primeiro ponto de corte e cada ponto
+        band_levels = [self._level_breakpoints[0] - 1] + self._level_breakpoints if breakpoints else [1]
+
+        self._subject_samplers = {}
+        for quest_type in self.actions:
+            valid = [s for s in subject_entries if self._is_valid_subject_for_action(quest_type, s)]
+            self._subject_samplers[quest_type] = [
+                self._build_subject_sampler(valid, level) for level in band_levels
+            ]
+
+        self._sub_location_tables = {
+            subject["key"]: self._build_sub_location_table(subject)
+            for subject in subject_entries
+        }
+
+        self._none_modifier = None
+        if "none" in self.modifiers:
+            self._none_modifier = dict(self.modifiers["none"])
+            self._none_modifier["key"] = "none"
+
+        self._modifier_samplers = {}
+        for category in {subject.get("category") for subject in subject_entries}:
+            self._modifier_samplers[category] = self._build_modifier_sampler({"category": category})
+
+        self._max_heroes_sampler = _WeightedSampler(
+            (int(k), v) for k, v in self.max_heroes_weights.items()
+        )
+
+    @staticmethod
+    def _build_subject_sampler(subjects: List[Dict], party_level: int) -> _WeightedSampler:
+        candidates = []
+        for subject in subjects:
+            if party_level < subject.get("min_level", 1):
+                continue
+
+            weight = subject.get("weight", 10)
+            if party_level > subject.get("max_level", 99):
+                weight = max(1, weight // 4)
+            candidates.append((subject, weight))
+
+        return _WeightedSampler(candidates)
+
+    def _build_sub_location_table(self, subject: Dict) -> tuple[Dict, _WeightedSampler]:
+        unique_sub_locations = {}
+        for group_key in subject.get("locations", []):
+            sub_location_group = self.sub_location_groups_raw.get(group_key, {})
+            for key, sub_location_data in sub_location_group.items():
+                sub_location = dict(sub_location_data)
+                sub_location["key"] = key
+                sub_location["type"] = group_key
+                unique_sub_locations[key] = sub_location
+
+        sampler = _WeightedSampler(
+            (sub_location, sub_location.get("weight", 10))
+            for sub_location in unique_sub_locations.values()
+        )
+        return unique_sub_locations, sampler
+
+    def _build_modifier_sampler(self, subject: Dict) -> _WeightedSampler:
+        valid_modifiers = []
+        for key, mod in self.modifiers.items():
+            if key == "none":
+                continue
+            mod_copy = dict(mod)
+            mod_copy["key"] = key
+            if self._is_valid_modifier_for_subject(mod_copy, subject):
+                valid_modifiers.append((mod_copy, mod_copy.get("weight", 10)))
+
+        return _WeightedSampler(valid_modifiers)
+
     # ============================================================
     # RANDOM / LOOKUP
     # ============================================================
 
-    def _random_key(self, mapping: Dict) -> str:
-        if not mapping:
-            raise ValueError("Map vazio para escolha aleatória")
-        return random.choice(list(mapping.keys()))
-
     def _get_action(self, quest_type: str) -> Dict:
         action = self.actions.get(quest_type)
         if not action:
@@ -291,7 +470,7 @@ class ProceduralQuestSystem:
             raise ValueError(f"Tipo '{quest_type}' não possui verbos")
 
         if verb_key is None:
-            verb_key = self._random_key(verbs)
+            verb_key = random.choice(self._verb_keys.get(quest_type) or tuple(verbs))
 
         verb = verbs.get(verb_key)
         if not verb:
@@ -359,8 +538,8 @@ class ProceduralQuestSystem:
         modifier = self._get_modifier_for_subject(subject, modifier_key, quest_type)
 
         max_heroes = self._get_max_heroes(max_heroes)
-        expired_at = self._clamp(expired_at if expired_at is not None else random.randint(3, 7), 1, 9)
-        duration = self._clamp(duration if duration is not None else random.randint(2, 5), 1, 9)
+        expired_at = self._clamp(expired_at if expired_at is not None else random.randint(*self.EXPIRED_AT_RANGE), 1, 9)
+        duration = self._clamp(duration if duration is not None else random.randint(*self.DURATION_RANGE), 1, 9)
 
         seed_str = (
             f"{action['id']:02d}"
@@ -393,7 +572,7 @@ class ProceduralQuestSystem:
     # QUEST BUILD
     # ============================================================
 
-    def reconstruct_quest_from_seed(self, seed: int) -> QuestData:
+    def decode_seed_parts(self, seed: int) -> tuple[Dict[str, int], SeedParts]:
         parts = self.decode_seed(seed)
 
         quest_type = self._get_type_by_id(parts["type_id"])
@@ -409,6 +588,12 @@ class ProceduralQuestSystem:
 
         modifier = self._get_modifier_by_id(parts["modifier_id"])
 
+        return parts, SeedParts(quest_type, verb, subject, location, sub_location, modifier)
+
+    def _compute_difficulty(self, parts: Dict[str, int], seed_parts: SeedParts) -> tuple[float, int]:
+        """Dificuldade bruta e XP da quest."""
+        _, verb, subject, location, sub_location, modifier = seed_parts
+
         difficulty_value = (
             verb.get("difficulty", 1.0)
             * subject.get("power", 1.0)
@@ -421,39 +606,20 @@ class ProceduralQuestSystem:
         duration_multiplier = {1: 1.00, 2: 1.08, 3: 1.15, 4: 1.22, 5: 1.28}.get(parts["duration"], 1.30)
         xp = int((difficulty_value * 45) * heroes_multiplier * duration_multiplier)
 
-        description = self._generate_description(quest_type, verb, subject, location, sub_location, modifier)
-        conclusion = self._generate_conclusion(quest_type, subject, location, sub_location, modifier)
-        narrative_context = self._generate_context(subject, location, sub_location, modifier)
+        return difficulty_value, xp
 
-        context = {
-            "location": self._compose_location_phrase(sub_location, location, self.language),
-            "location_key": location.get("key", ""),
-            "sub_location_key": sub_location.get("key", ""),
-            "location_type": sub_location.get("type", ""),   # ← "bridge", "forest", etc
-            "enemy": self._compose_subject_phrase(quest_type, subject, modifier, self.language),
-            "enemy_type": self._get_modifier_form(modifier, subject, self.language),
-            "subject_category": subject.get("category", "unknown"),
-            "action_type": quest_type,
-            "narrative": narrative_context[self.language],
-        }
-
-        sub_loc_text_pt = self._get_location_with_preposition(sub_location, "em", "pt")
-        sub_loc_text_en = self._get_location_with_preposition(sub_location, "em", "en")
-        sub_loc_text_es = self._get_location_with_preposition(sub_location, "em", "es")
+    def reconstruct_quest_from_seed(self, seed: int) -> QuestData:
+        """QuestData completo, com os textos só no idioma atual."""
+        parts, seed_parts = self.decode_seed_parts(seed)
+        difficulty_value, xp = self._compute_difficulty(parts, seed_parts)
+        lang = self.language
 
         return {
             "seed": seed,
             "id": seed,
-            "name": {
-                "pt": f"{verb.get('pt', '')} {self._compose_subject_phrase(quest_type, subject, modifier, 'pt')} {sub_loc_text_pt}".strip(),
-                "en": f"{verb.get('en', '')} {self._compose_subject_phrase(quest_type, subject, modifier, 'en')} {sub_loc_text_en}".strip(),
-                "es": f"{verb.get('es', verb.get('en', ''))} {self._compose_subject_phrase(quest_type, subject, modifier, 'es')} {sub_loc_text_es}".strip(),
-                "ru": f"{verb.get('ru', '')} {self._compose_subject_phrase(quest_type, subject, modifier, 'ru')}",
-                "zh": f"{verb.get('zh', '')} {self._compose_subject_phrase(quest_type, subject, modifier, 'zh')}",
-                "ja": f"{verb.get('ja', '')} {self._compose_subject_phrase(quest_type, subject, modifier, 'ja')}",
-            },
-            "description": description,
-            "type": quest_type,
+            "name": {lang: self._get_text(seed, seed_parts, lang, "name")},
+            "description": {lang: self._get_text(seed, seed_parts, lang, "description")},
+            "type": seed_parts.quest_type,
             "max_heroes": parts["max_heroes"],
             "expired_at": parts["expired_at"],
             "available_from_turn": 1,
@@ -463,68 +629,151 @@ class ProceduralQuestSystem:
             "required_quests": [],
             "forbidden_quests": [],
             "required_perks": [],
-            "context": context,
-            "conclusion": conclusion,
+            "context": self._get_text(seed, seed_parts, lang, "context"),
+            "conclusion": self._get_text(seed, seed_parts, lang, "conclusion"),
             "is_procedural": True,
         }
 
-    def to_quest_object(self, quest_data: QuestData) -> Quest:
-        quest = Quest(
-            id=quest_data["id"],
-            name=quest_data["name"],
-            description=quest_data["description"],
-            type=quest_data["type"],
-            max_heroes=quest_data["max_heroes"],
-            expired_at=quest_data.get("expired_at", 5),
-            available_from_turn=quest_data.get("available_from_turn", 1),
-            duration=quest_data["duration"],
-            difficulty=quest_data["difficulty"],
-            rewards=quest_data["rewards"],
-            required_quests=quest_data.get("required_quests", []),
-            forbidden_quests=quest_data.get("forbidden_quests", []),
-            required_perks=quest_data.get("required_perks", []),
-            context=quest_data.get("context", {}),
-            conclusion=quest_data.get("conclusion", {}),
-            language=self.language,
-        )
-
-        quest.is_procedural = True
-        quest.seed = quest_data["seed"]
-        return quest
-
     # ============================================================
     # PUBLIC API
     # ============================================================
 
     def generate_quest_of_type(self, quest_type: QuestType, party_level: int = 1) -> Quest:
         seed = self.generate_seed(quest_type, party_level)
-        quest_data = self.reconstruct_quest_from_seed(seed)
-        return self.to_quest_object(quest_data)
+        return self.get_quest_from_seed(seed)
 
     def get_quest_from_seed(self, seed: int) -> Quest:
-        quest_data = self.reconstruct_quest_from_seed(seed)
-        return self.to_quest_object(quest_data)
+        """
+        Quest procedural com textos sob demanda: nome, descrição, conclusão e
+        context só são montados quando lidos, no idioma da quest.
+        """
+        parts, seed_parts = self.decode_seed_parts(seed)
+        difficulty_value, xp = self._compute_difficulty(parts, seed_parts)
 
-    def ensure_min_available(self, min_count: int = 3) -> List[Quest]:
-        all_types = list(self.actions.keys())
-        if not all_types:
-            return []
-
-        while len(self.seeds["available"]) < min_count:
-            used_seeds = self.seeds["available"] | set(self.seeds["active"].keys()) | self.seeds["completed"]
-            seed = None
-
-            for _ in range(100):
-                quest_type = random.choice(all_types)
-                candidate = self.generate_seed(quest_type)
-                if candidate not in used_seeds:
-                    seed = candidate
+        quest = Quest(
+            id=seed,
+            name=None,
+            description=None,
+            type=seed_parts.quest_type,
+            max_heroes=parts["max_heroes"],
+            expired_at=parts["expired_at"],
+            available_from_turn=1,
+            duration=parts["duration"],
+            difficulty=max(1, round(difficulty_value)),
+            rewards={"xp": xp},
+            required_quests=[],
+            forbidden_quests=[],
+            required_perks=[],
+            language=self._language,
+            seed_parts=seed_parts,
+            text_source=self,
+        )
+
+        quest.is_procedural = True
+        quest.seed = seed
+        return quest
+
+    def render_quest_text(self, quest: Quest, part: str):
+        """Texto `part` ("name", "description", "conclusion", "context") no idioma da quest."""
+        lang = quest.language if quest.language in self.SUPPORTED_LANGUAGES else "pt"
+        return self._get_text(quest.seed, quest.seed_parts, lang, part)
+
+    def generate_batch(
+        self,
+        n: int,
+        quest_type: Optional[QuestType] = None,
+        party_level: int = 1,
+        exclude: Container[int] = (),
+    ) -> Iterator[Quest]:
+        """
+        Gera `n` quests com seeds distintas entre si e fora de `exclude`.
+
+        Sem `quest_type`, cada quest sorteia o seu tipo. As quests são montadas
+        sob demanda: quem para de consumir no meio não paga o resto.
+        """
+        seeds = self.generate_unique_seeds(n, quest_type, party_level, exclude)
+        return (self.get_quest_from_seed(seed) for seed in seeds)
+
+    def generate_unique_seeds(
+        self,
+        n: int,
+        quest_type: Optional[QuestType] = None,
+        party_level: int = 1,
+        exclude: Container[int] = (),
+    ) -> Iterator[int]:
+        """
+        Seeds de generate_batch(). Falha já na chamada com ValueError se `n`
+        passa do espaço de combinações, e durante a iteração se o espaço se
+        esgotar (MAX_SEED_ATTEMPTS sorteios repetidos seguidos).
+        """
+        candidate_types = [quest_type] if quest_type is not None else list(self.actions)
+        space = {qt: self.seed_space_size(qt, party_level) for qt in candidate_types}
+        quest_types = [qt for qt in candidate_types if space[qt]]  # tipos sem combinação não são sorteados
+
+        capacity = sum(space.values())
+        if n > capacity:
+            raise ValueError(
+                f"{n} quests pedidas, mas só existem {capacity} combinações "
+                f"para '{quest_type or 'todos'}' no nível {party_level}"
+            )
+
+        return self._iter_unique_seeds(n, quest_type, quest_types, party_level, exclude)
+
+    def _iter_unique_seeds(self, n, quest_type, quest_types, party_level, exclude) -> Iterator[int]:
+        seen = set()
+
+        for _ in range(n):
+            for _ in range(self.MAX_SEED_ATTEMPTS):
+                current_type = quest_type if quest_type is not None else random.choice(quest_types)
+                seed = self.generate_seed(current_type, party_level)
+                if seed not in seen and seed not in exclude:
                     break
+            else:
+                raise ValueError(
+                    f"Espaço de seeds esgotado após {len(seen)} quests únicas "
+                    f"('{quest_type or 'todos'}', nível {party_level})"
+                )
 
-            if seed is None:
-                break
+            seen.add(seed)
+            yield seed
+
+    def seed_space_size(self, quest_type: str, party_level: int = 1) -> int:
+        """Quantas seeds distintas generate_seed() consegue produzir para o tipo e nível."""
+        bands = self._subject_samplers.get(quest_type)
+        if not bands:
+            return 0
+        subjects = bands[bisect_right(self._level_breakpoints, party_level)].items
+
+        places_and_modifiers = 0
+        for subject in subjects:
+            unique_sub_locations, _ = self._sub_location_tables.get(subject["key"], ({}, None))
+            places = sum(len(sub_location.get("locations", [])) for sub_location in unique_sub_locations.values())
+
+            modifier_sampler = self._modifier_samplers.get(subject.get("category"))
+            modifiers = (1 if "none" in self.modifiers else 0) + len(modifier_sampler.items if modifier_sampler else ())
+            places_and_modifiers += places * modifiers
+
+        max_heroes_options = len({self._clamp(v, 1, 4) for v in self._max_heroes_sampler.items}) or 4
+        expired_options = self.EXPIRED_AT_RANGE[1] - self.EXPIRED_AT_RANGE[0] + 1
+        duration_options = self.DURATION_RANGE[1] - self.DURATION_RANGE[0] + 1
+
+        return (
+            len(self._verb_keys.get(quest_type, ()))
+            * places_and_modifiers
+            * max_heroes_options
+            * expired_options
+            * duration_options
+        )
 
-            self.seeds["available"].add(seed)
+    def ensure_min_available(self, min_count: int = 3) -> List[Quest]:
+        missing = min_count - len(self.seeds["available"])
+        if missing > 0 and self.actions:
+            used_seeds = self.seeds["available"] | self.seeds["active"].keys() | self.seeds["completed"]
+            try:
+                for seed in self.generate_unique_seeds(missing, exclude=used_seeds):
+                    self.seeds["available"].add(seed)
+            except ValueError as e:
+                print(f"[ProcSystem] ⚠️ {e}")
 
         return self.get_available_quests()
 
@@ -549,17 +798,80 @@ class ProceduralQuestSystem:
     # TEXT HELPERS
     # ============================================================
 
-    def _generate_description(self, quest_type: str, verb: dict, subject: dict, location: dict, sub_location: dict, modifier: dict) -> dict:
+    def _get_text(self, seed: int, seed_parts: SeedParts, lang: str, part: str):
+        key = (seed, lang)
+        texts = self._text_cache.get(key)
+        if texts is None:
+            texts = self._text_cache[key] = {}
+            if len(self._text_cache) > self.TEXT_CACHE_SIZE:
+                self._text_cache.popitem(last=False)
+        else:
+            self._text_cache.move_to_end(key)
+
+        value = texts.get(part)
+        if value is None:
+            value = texts[part] = self._render_text(seed, seed_parts, lang, part)
+            # Igual ao Quest._get_lang_value: texto vazio cai para o português
+            if not value and lang != "pt" and part in ("name", "description"):
+                value = texts[part] = self._get_text(seed, seed_parts, "pt", part)
+        return value
+
+    def _render_text(self, seed: int, seed_parts: SeedParts, lang: str, part: str):
+        quest_type, verb, subject, location, sub_location, modifier = seed_parts
+
+        if part == "name":
+            return self._generate_name(quest_type, verb, subject, sub_location, modifier, lang)
+        if part == "description":
+            return self._generate_description(quest_type, verb, subject, location, sub_location, modifier, (lang,), seed)[lang]
+        if part == "conclusion":
+            return self._generate_conclusion(quest_type, subject, location, sub_location, modifier, (lang,))
+        if part == "context":
+            return self._build_context(seed_parts, lang)
+        raise ValueError(f"Texto de quest desconhecido: '{part}'")
+
+    def _generate_name(self, quest_type: str, verb: dict, subject: dict, sub_location: dict, modifier: dict, lang: str) -> str:
+        subject_phrase = self._compose_subject_phrase(quest_type, subject, modifier, lang)
+
+        if lang not in {"pt", "en", "es"}:
+            return f"{verb.get(lang, '')} {subject_phrase}"
+
+        verb_text = verb.get("es", verb.get("en", "")) if lang == "es" else verb.get(lang, "")
+        sub_loc_text = self._get_location_with_preposition(sub_location, "em", lang)
+        return f"{verb_text} {subject_phrase} {sub_loc_text}".strip()
+
+    def _build_context(self, seed_parts: SeedParts, lang: str) -> dict:
+        quest_type, verb, subject, location, sub_location, modifier = seed_parts
+        narrative_context = self._generate_context(subject, location, sub_location, modifier, (lang,))
+
+        context = {
+            "location": self._compose_location_phrase(sub_location, location, lang),
+            "location_key": location.get("key", ""),
+            "sub_location_key": sub_location.get("key", ""),
+            "location_type": sub_location.get("type", ""),   # ← "bridge", "forest", etc
+            "enemy": self._compose_subject_phrase(quest_type, subject, modifier, lang),
+            "enemy_type": self._get_modifier_form(modifier, subject, lang),
+            "subject_category": subject.get("category", "unknown"),
+            "action_type": quest_type,
+            "narrative": narrative_context[lang],
+        }
+
+        for key in INTERNED_CONTEXT_KEYS:
+            context[key] = sys.intern(context[key])
+        return context
+
+    def _generate_description(self, quest_type: str, verb: dict, subject: dict, location: dict, sub_location: dict, modifier: dict, languages=None, seed: Optional[int] = None) -> dict:
         fragments_root = self.text_fragments.get("description", {})
         type_fragments = fragments_root.get(quest_type, {})
         result = {}
 
-        for lang in self.SUPPORTED_LANGUAGES:
-            intro_tpl = self._pick_fragment(type_fragments, "intro", lang, required=False)
-            context_tpl = self._pick_fragment(type_fragments, "objective_context", lang, required=False)
-            objective_tpl = self._pick_fragment(type_fragments, "objective", lang, required=False)
-            detail_tpl = self._pick_fragment(type_fragments, "detail", lang, required=False)
-            pressure_tpl = self._pick_fragment(type_fragments, "pressure", lang, required=False)
+        for lang in languages or self.SUPPORTED_LANGUAGES:
+            # Com seed, os fragmentos sorteados dependem só de (seed, idioma)
+            rng = self._text_rng(seed, lang) if seed is not None else random
+            intro_tpl = self._pick_fragment(type_fragments, "intro", lang, required=False, rng=rng)
+            context_tpl = self._pick_fragment(type_fragments, "objective_context", lang, required=False, rng=rng)
+            objective_tpl = self._pick_fragment(type_fragments, "objective", lang, required=False, rng=rng)
+            detail_tpl = self._pick_fragment(type_fragments, "detail", lang, required=False, rng=rng)
+            pressure_tpl = self._pick_fragment(type_fragments, "pressure", lang, required=False, rng=rng)
 
             subject_phrase = self._compose_subject_phrase(quest_type, subject, modifier, lang)
             sub = self._get_location_with_preposition(sub_location, "de", lang)
@@ -594,43 +906,52 @@ class ProceduralQuestSystem:
 
         return result
 
-    def _generate_conclusion(self, quest_type: str, subject: Dict, location: Dict, sub_location: Dict, modifier: Dict) -> Dict[str, Dict[str, str]]:
-        pt_subject = self._get_subject_text(subject, "pt") or "alvos"
-        en_subject = self._get_subject_text(subject, "en") or "targets"
-        es_subject = self._get_subject_text(subject, "es") or en_subject
+    def _generate_conclusion(self, quest_type: str, subject: Dict, location: Dict, sub_location: Dict, modifier: Dict, languages=None) -> Dict[str, Dict[str, str]]:
+        result = {"success": {}, "failure": {}}
 
-        pt_modifier = self._get_modifier_form(modifier, subject, "pt")
-        en_modifier = self._get_modifier_form(modifier, subject, "en")
-        es_modifier = self._get_modifier_form(modifier, subject, "es") or en_modifier
+        for lang in languages or self.CONCLUSION_TEMPLATES:
+            templates = self.CONCLUSION_TEMPLATES.get(lang)
+            if not templates:
+                continue
 
-        pt_location = self._compose_location_phrase(location, sub_location, "pt") or "na região"
-        en_location = self._compose_location_phrase(location, sub_location, "en") or "in the region"
-        es_location = self._compose_location_phrase(location, sub_location, "es") or en_location
+            terms = self._conclusion_terms(subject, location, sub_location, modifier, lang)
+            for outcome, template in templates.items():
+                result[outcome][lang] = template.format(**terms).strip()
 
-        return {
-            "success": {
-                "pt": f"A operação contra {pt_subject} {pt_modifier} {pt_location} foi concluída com sucesso.".strip(),
-                "en": f"The operation against the {en_modifier} {en_subject} {en_location} was completed successfully.".strip(),
-                "es": f"La operación contra {es_subject} {es_modifier} {es_location} fue completada con éxito.".strip(),
-            },
-            "failure": {
-                "pt": f"A missão envolvendo {pt_subject} {pt_modifier} {pt_location} falhou.".strip(),
-                "en": f"The mission involving the {en_modifier} {en_subject} {en_location} has failed.".strip(),
-                "es": f"La misión relacionada con {es_subject} {es_modifier} {es_location} ha fracasado.".strip(),
-            },
+        return result
+
+    def _conclusion_terms(self, subject: Dict, location: Dict, sub_location: Dict, modifier: Dict, lang: str) -> Dict[str, str]:
+        terms = {
+            "subject": self._get_subject_text(subject, lang),
+            "modifier": self._get_modifier_form(modifier, subject, lang),
+            "location": self._compose_location_phrase(location, sub_location, lang),
         }
 
+        # Espanhol completa o que faltar com o inglês; pt/en têm texto padrão
+        if lang == "es":
+            english = self._conclusion_terms(subject, location, sub_location, modifier, "en")
+            return {key: value or english[key] for key, value in terms.items()}
+
+        terms["subject"] = terms["subject"] or {"pt": "alvos", "en": "targets"}.get(lang, "")
+        terms["location"] = terms["location"] or {"pt": "na região", "en": "in the region"}.get(lang, "")
+        return terms
+
     def _localize(self, data: dict, lang: str) -> str:
         value = data.get(lang) or data.get("pt") or data.get("en") or ""
         if isinstance(value, dict):
             return value.get("text", "")
         return value
 
-    def _pick_fragment(self, fragments: dict, group: str, lang: str, required: bool = True) -> str:
+    @staticmethod
+    def _text_rng(seed: int, lang: str) -> random.Random:
+        """RNG dos textos de uma quest: a mesma seed e idioma sorteiam sempre os mesmos fragmentos."""
+        return random.Random(f"{seed}:{lang}")
+
+    def _pick_fragment(self, fragments: dict, group: str, lang: str, required: bool = True, rng=random) -> str:
         options = fragments.get(group, [])
         if not options:
             return ""
-        chosen = random.choice(options)
+        chosen = rng.choice(options)
         return chosen.get(lang) or chosen.get("pt") or chosen.get("en") or ""
 
     def _compose_subject_phrase(self, quest_type: str, subject: dict, modifier: dict, lang: str) -> str:
@@ -739,28 +1060,12 @@ class ProceduralQuestSystem:
             subject_copy["key"] = subject_key
             return subject_copy
 
-        candidates = []
-        for key, subject in self.subjects.items():
-            if not self._is_valid_subject_for_action(quest_type, subject):
-                continue
-
-            min_level = subject.get("min_level", 1)
-            max_level = subject.get("max_level", 99)
-            if party_level < min_level:
-                continue
-
-            weight = subject.get("weight", 10)
-            if party_level > max_level:
-                weight = max(1, weight // 4)
-
-            subject_copy = dict(subject)
-            subject_copy["key"] = key
-            candidates.append((subject_copy, weight))
-
-        if not candidates:
+        bands = self._subject_samplers.get(quest_type)
+        sampler = bands[bisect_right(self._level_breakpoints, party_level)] if bands else None
+        if not sampler:
             raise ValueError(f"Nenhum subject válido para '{quest_type}' no nível {party_level}")
 
-        return self._weighted_choice(candidates)
+        return sampler.pick()
 
     def _get_sub_location_for_subject(self, subject: Dict, sub_location_key: Optional[str] = None) -> Dict:
         subject_key = subject.get("key", "?")
@@ -769,31 +1074,21 @@ class ProceduralQuestSystem:
         if not sub_location_group_keys:
             raise ValueError(f"Subject '{subject_key}' sem grupos de sub_location definidos")
 
-        valid_sub_locations = []
-        for group_key in sub_location_group_keys:
-            sub_location_group = self.sub_location_groups_raw.get(group_key, {})
-            for key, sub_location_data in sub_location_group.items():
-                sub_location = dict(sub_location_data)
-                sub_location["key"] = key
-                sub_location["type"] = group_key
-                valid_sub_locations.append(sub_location)
+        table = self._sub_location_tables.get(subject_key)
+        if table is None or subject_key not in self.subjects:
+            table = self._build_sub_location_table(subject)
+        unique_sub_locations, sampler = table
 
-        unique_sub_locations = {}
-        for sub_location in valid_sub_locations:
-            unique_sub_locations[sub_location["key"]] = sub_location
-        valid_sub_locations = list(unique_sub_locations.values())
-
-        if not valid_sub_locations:
+        if not sampler:
             raise ValueError(f"Subject '{subject_key}' não possui sub_locations válidas")
 
         if sub_location_key is not None:
-            for sub_location in valid_sub_locations:
-                if sub_location["key"] == sub_location_key:
-                    return sub_location
+            sub_location = unique_sub_locations.get(sub_location_key)
+            if sub_location is not None:
+                return sub_location
             raise ValueError(f"Sub-location '{sub_location_key}' inválida para subject '{subject_key}'")
 
-        weighted_sub_locations = [(sub_location, sub_location.get("weight", 10)) for sub_location in valid_sub_locations]
-        return self._weighted_choice(weighted_sub_locations)
+        return sampler.pick()
 
     def _get_location_for_sub_location(self, sub_location: Dict, location_key: Optional[str] = None) -> Dict:
         valid_keys = sub_location.get("locations", [])
@@ -846,25 +1141,24 @@ class ProceduralQuestSystem:
         roll = random.uniform(0, roll_total)
 
         if roll <= none_weight:
-            modifier = dict(self.modifiers["none"])
-            modifier["key"] = "none"
-            return modifier
+            return self._get_none_modifier()
 
-        valid_modifiers = []
-        for key, mod in self.modifiers.items():
-            if key == "none":
-                continue
-            mod_copy = dict(mod)
-            mod_copy["key"] = key
-            if self._is_valid_modifier_for_subject(mod_copy, subject):
-                valid_modifiers.append((mod_copy, mod_copy.get("weight", 10)))
+        category = subject.get("category")
+        sampler = self._modifier_samplers.get(category)
+        if sampler is None:
+            sampler = self._modifier_samplers[category] = self._build_modifier_sampler(subject)
 
-        if not valid_modifiers:
+        if not sampler:
+            return self._get_none_modifier()
+
+        return sampler.pick()
+
+    def _get_none_modifier(self) -> Dict:
+        if self._none_modifier is None:
             modifier = dict(self.modifiers["none"])
             modifier["key"] = "none"
             return modifier
-
-        return self._weighted_choice(valid_modifiers)
+        return self._none_modifier
 
     # ============================================================
     # UTILS
@@ -874,44 +1168,19 @@ class ProceduralQuestSystem:
     def _clamp(value: int, min_value: int, max_value: int) -> int:
         return max(min_value, min(max_value, value))
 
-    def _weighted_choice(self, items: list[tuple[dict, int]]) -> dict:
-        total = sum(weight for _, weight in items)
-        roll = random.uniform(0, total)
-        current = 0
-
-        for item, weight in items:
-            current += weight
-            if roll <= current:
-                return item
-
-        return items[-1][0]
-
-    def _weighted_choice_simple(self, choices: list[tuple[object, int]]):
-        total = sum(weight for _, weight in choices)
-        roll = random.uniform(0, total)
-        current = 0
-
-        for value, weight in choices:
-            current += weight
-            if roll <= current:
-                return value
-
-        return choices[-1][0]
-
     def _get_max_heroes(self, max_heroes: Optional[int]) -> int:
         if max_heroes is not None:
             return self._clamp(max_heroes, 1, 4)
 
-        choices = [(int(k), v) for k, v in self.max_heroes_weights.items()]
-        if not choices:
+        if not self._max_heroes_sampler:
             return random.randint(1, 4)
 
-        return self._clamp(self._weighted_choice_simple(choices), 1, 4)
+        return self._clamp(self._max_heroes_sampler.pick(), 1, 4)
 
-    def _generate_context(self, subject: dict, location: dict, sub_location: dict, modifier: dict) -> dict:
+    def _generate_context(self, subject: dict, location: dict, sub_location: dict, modifier: dict, languages=None) -> dict:
         result = {}
 
-        for lang in self.SUPPORTED_LANGUAGES:
+        for lang in languages or self.SUPPORTED_LANGUAGES:
             result[lang] = {
                 "enemy": {
                     "details": self._localize_context_list(subject, "details", lang),
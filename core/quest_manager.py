@@ -3,10 +3,10 @@ import random
 from core.hero_manager import HeroManager
 from core.quest import Quest
 from core.quest_success_calculator import calculate_success_chance, run_mission_roll
-from core.save_manager import save_game, load_game
+from core.save_manager import save_game_async, load_game
 from core.assistant_manager import AssistantManager
-from collections import defaultdict
-from core.language_manager import LanguageManager
+from collections import OrderedDict, defaultdict
+from core.language_manager import get_language_manager
 from core.steam_manager import SteamManager
 from core.quest_requirements import (
     check_required_quests,
@@ -19,8 +19,26 @@ from core.quest_requirements import (
     process_expired_quests,
 )
 from core.quest_gen import ProceduralQuestSystem
+from core.quest_availability import QuestAvailability
+
+
+class _KnownQuestIds:
+    """
+    IDs já usados (registro vivo + procedurais arquivadas), só para `in`.
+    Consulta os dois conjuntos na hora, sem montar a união a cada turno.
+    """
+    __slots__ = ("registry", "archived")
+
+    def __init__(self, registry, archived):
+        self.registry = registry
+        self.archived = archived
+
+    def __contains__(self, quest_id) -> bool:
+        return quest_id in self.registry or quest_id in self.archived
+
 
 class QuestManager:
+    RECONSTRUCTED_CACHE_SIZE = 128  # procedurais fora do registro mantidas em memória
     def __init__(self, save_file="auto_save.json"):
         self.save_file = save_file
         self.requirement_checks = [
@@ -33,30 +51,43 @@ class QuestManager:
             check_available_turn,
         ]
 
-        self.lm = LanguageManager()
-        self.hero_manager = HeroManager(language=self.lm.language)
-        self.quest_registry = {}  # {quest_id: Quest}
+        self.lm = get_language_manager()
+        # Heróis e quests seguem o idioma ativo: trocar de idioma não recarrega nada
+        self.hero_manager = HeroManager(language=None)
+        self.quest_registry = {}  # {quest_id: Quest} — só quests vivas
+        self.archived_quests = set()  # procedurais resolvidas: só a seed (= id) fica
+        self._location_index = defaultdict(dict)  # {sub_location_key: {quest_id: None}} — não resolvidas
 
-        self.quests = Quest.load_quests(language=self.lm.language)
+        # {seed: Quest} — LRU das procedurais reconstruídas fora do registro
+        self._reconstructed = OrderedDict()
+        self.reconstructed_hits = 0
+        self.reconstructed_misses = 0
+
+        self.completed_quests = defaultdict(set)
+        self.failed_quests = set()
+        self.active_quests = {}     # {quest_id: {"heroes": [...], "turns_left": n}}
+        self.current_turn = 1
+
+        self.availability = QuestAvailability(self)
+
+        self.quests = Quest.load_quests(language=None)
         for quest in self.quests:
             quest.origin = "handcrafted"
-            self.quest_registry[quest.id] = quest
+            self._register_quest(quest)
         self.procedural_pool = {}  # {seed: Quest}
 
         self.proc_gen = ProceduralQuestSystem(
-            language=self.lm.language,
+            language=None,
             data_file="data/quest_data.json"
         )
 
-        self.completed_quests = defaultdict(set)
-        self.failed_quests = set()
-        self.active_quests = {}     # {quest_id: {"heroes": [...], "turns_left": n}}
-        self.current_turn = 1
-
         self.log_callback = None
         self.dialog_callback = None
         self.ui_callback = None
 
+        # Última versão das listas entregue à UI: {lista: {quest_id: nome}}
+        self._published_quests = {"active": {}, "available": {}}
+
         self.assistant = AssistantManager(self.lm)
         self.steam = SteamManager()
 
@@ -94,20 +125,111 @@ class QuestManager:
         if quest:
             return quest
 
-        # fallback procedural
+        # fallback procedural: reconstrói da seed, sem entrar no registro
         if isinstance(quest_id, int):
-            try:
-                quest_data = self.proc_gen.reconstruct_quest_from_seed(quest_id)
-                quest = self.proc_gen.to_quest_object(quest_data)
-                quest.origin = "procedural"
-
-                self.quest_registry[quest_id] = quest
-                return quest
-            except Exception as e:
-                print(f"[QM] erro: {e}")
+            return self._get_reconstructed(quest_id)
 
         return None
 
+    def restore_quest(self, quest_id):
+        """
+        Como get_quest, mas uma procedural ainda não resolvida volta para o
+        registro (quests ativas/disponíveis de um save carregado).
+        """
+        quest = self.get_quest(quest_id)
+        if quest is None or quest_id in self.quest_registry or self._is_resolved(quest_id):
+            return quest
+
+        self._reconstructed.pop(quest_id, None)
+        self.archived_quests.discard(quest_id)
+        self._register_quest(quest)
+        return quest
+
+    def _get_reconstructed(self, quest_id):
+        quest = self._reconstructed.get(quest_id)
+        if quest is not None:
+            self._reconstructed.move_to_end(quest_id)
+            self.reconstructed_hits += 1
+            return quest
+
+        self.reconstructed_misses += 1
+        try:
+            quest = self.proc_gen.get_quest_from_seed(quest_id)
+        except Exception as e:
+            print(f"[QM] erro: {e}")
+            return None
+
+        quest.origin = "procedural"
+        if self._is_resolved(quest_id):
+            self.archived_quests.add(quest_id)
+
+        self._remember_reconstructed(quest)
+        return quest
+
+    def _remember_reconstructed(self, quest):
+        self._reconstructed[quest.id] = quest
+        self._reconstructed.move_to_end(quest.id)
+        if len(self._reconstructed) > self.RECONSTRUCTED_CACHE_SIZE:
+            self._reconstructed.popitem(last=False)
+
+    def reconstructed_cache_stats(self) -> dict:
+        return {
+            "size": len(self._reconstructed),
+            "capacity": self.RECONSTRUCTED_CACHE_SIZE,
+            "hits": self.reconstructed_hits,
+            "misses": self.reconstructed_misses,
+        }
+
+    def _register_quest(self, quest):
+        self.quest_registry[quest.id] = quest
+        self.availability.track(quest)
+        if not self._is_resolved(quest.id):
+            self._location_index[self._quest_location(quest)][quest.id] = None
+
+    @staticmethod
+    def _quest_location(quest) -> str:
+        return quest.context.get("sub_location_key", "")
+
+    def _on_quest_resolved(self, quest):
+        """Quest concluída, falhada ou expirada: atualiza índices e arquiva se for procedural."""
+        self.availability.on_quest_resolved(quest.id)
+        if self._is_resolved(quest.id):
+            self._location_index[self._quest_location(quest)].pop(quest.id, None)
+            self.archive_quest(quest.id)
+
+    def _rebuild_location_index(self):
+        self._location_index = defaultdict(dict)
+        for qid, quest in self.quest_registry.items():
+            if not self._is_resolved(qid):
+                self._location_index[self._quest_location(quest)][qid] = None
+
+    def _is_resolved(self, quest_id) -> bool:
+        return quest_id in self.completed_quests or quest_id in self.failed_quests
+
+    def archive_quest(self, quest_id):
+        """
+        Tira do registro uma quest procedural já resolvida (concluída, falhada
+        ou expirada). Ela continua acessível por get_quest, reconstruída da seed.
+        """
+        quest = self.quest_registry.get(quest_id)
+        if quest is None or not getattr(quest, "is_procedural", False):
+            return
+        if not self._is_resolved(quest_id):
+            return
+
+        del self.quest_registry[quest_id]
+        self.availability.untrack(quest_id)
+        self.archived_quests.add(quest_id)
+        # Popup de concluídas e afins costumam pedir as recém-resolvidas
+        self._remember_reconstructed(quest)
+
+    def _archive_resolved_quests(self):
+        for quest_id in [
+            qid for qid, quest in self.quest_registry.items()
+            if getattr(quest, "is_procedural", False) and self._is_resolved(qid)
+        ]:
+            self.archive_quest(quest_id)
+
     # ──────────────────────────────────────────────────────────────────────────
     # Quests — Envio
     # ──────────────────────────────────────────────────────────────────────────
@@ -118,7 +240,7 @@ class QuestManager:
         if not quest:
             return self.lm.t("quest_not_found").format(id=quest_id)
 
-        selected_heroes = [self.get_hero(hid) for hid in hero_ids if self.get_hero(hid)]
+        selected_heroes = [hero for hid in hero_ids if (hero := self.get_hero(hid))]
         if not selected_heroes:
             return self.lm.t("no_valid_hero_selected")
 
@@ -129,6 +251,7 @@ class QuestManager:
             "heroes": selected_heroes,
             "turns_left": quest.duration
         }
+        self.availability.mark_dirty(quest_id)
 
         self._log(self.lm.t("heroes_sent").format(name=quest.name, turns=quest.duration))
 
@@ -200,6 +323,8 @@ class QuestManager:
             else:
                 self.failed_quests.add(quest.id)
 
+        self._on_quest_resolved(quest)
+
         for hero in heroes:
             try:
                 hero.status = "idle"
@@ -220,32 +345,16 @@ class QuestManager:
     def available_quests(self):
         process_expired_quests(self)
 
-        quests_list = []
+        # Só as quests com insumos alterados são reavaliadas
+        quests_list = self.availability.refresh()
         new_quests = 0
 
-        all_quests = list(self.quest_registry.values())
-
-        for quest in all_quests:
-            if (quest.id in self.completed_quests or
-                    quest.id in self.failed_quests or
-                    quest.id in self.active_quests):
-                continue
-
-            self._handle_quest_map_impact(quest)
-
-            passes_requirements = all(
-                check(quest, self) for check in self.requirement_checks
-            )
-            if not passes_requirements:
-                continue
-
+        for quest in quests_list:
             # Marca o turno de nascimento — uma vez, para sempre
             if getattr(quest, "available_since_turn", None) is None:
                 quest.available_since_turn = self.current_turn
                 new_quests += 1
 
-            quests_list.append(quest)
-
         if new_quests > 0 and self.assistant:
             if self.assistant.dialogue_box:
                 self.assistant.on_new_quests(new_quests)
@@ -255,11 +364,41 @@ class QuestManager:
         return quests_list
 
     def get_active_quests(self):
-        return [self.get_quest(qid) for qid in self.active_quests if self.get_quest(qid)]
+        return [quest for qid in self.active_quests if (quest := self.get_quest(qid))]
 
     def get_available_quests(self):
         return self.available_quests()
 
+    def get_quest_changes(self) -> dict:
+        """
+        Diferença das listas de quests desde a última consulta.
+
+        Retorna {"active": {...}, "available": {...}}, cada uma com os IDs
+        "added", "removed" e "updated" (nome mudou) e a "order" atual.
+        """
+        current = {
+            "active": {quest.id: quest.name for quest in self.get_active_quests()},
+            "available": {quest.id: quest.name for quest in self.get_available_quests()},
+        }
+
+        changes = {}
+        for key, quests in current.items():
+            previous = self._published_quests.get(key, {})
+            changes[key] = {
+                "added": [qid for qid in quests if qid not in previous],
+                "removed": [qid for qid in previous if qid not in quests],
+                "updated": [qid for qid, name in quests.items()
+                            if qid in previous and previous[qid] != name],
+                "order": list(quests),
+            }
+
+        self._published_quests = current
+        return changes
+
+    def reset_quest_changes(self):
+        """Faz a próxima get_quest_changes() entregar todas as quests como novas."""
+        self._published_quests = {"active": {}, "available": {}}
+
     # ──────────────────────────────────────────────────────────────────────────
     # Turno
     # ──────────────────────────────────────────────────────────────────────────
@@ -289,7 +428,7 @@ class QuestManager:
             self.resolve_quest(qid, data)
             self.active_quests.pop(qid, None)
 
-        save_game(self, self.save_file)
+        save_game_async(self, self.save_file)
 
     # ──────────────────────────────────────────────────────────────────────────
     # Geração Procedural
@@ -324,12 +463,7 @@ class QuestManager:
         # Delta fixo por turno: metade dos disponíveis, limitado pelo headroom
         to_generate = min(available_count // 2, headroom)
 
-        for _ in range(to_generate):
-            quest = self._generate_new_procedural()
-            if quest:
-                self.quest_registry[quest.id] = quest
-            else:
-                break
+        self._generate_procedural_batch(to_generate)
 
     def _get_average_hero_level(self) -> int:
         unlocked = [
@@ -385,12 +519,6 @@ class QuestManager:
     # Utilitários
     # ──────────────────────────────────────────────────────────────────────────
 
-    def load_quests(self, language: str = "pt"):
-        from core.quest import Quest
-        self.language = language
-        self.quests = Quest.load_quests(language)
-        print(f"📜 Quests carregadas no idioma: {language}")
-
     def _revalidate_available_quests(self):
         from core.quest_requirements import (
             check_available_turn,
@@ -418,27 +546,47 @@ class QuestManager:
                 # Se NÃO deveria estar disponível, reseta o available_since_turn
                 quest.available_since_turn = None
 
+        # Estado carregado de fora: arquiva as procedurais já resolvidas e
+        # recalcula a disponibilidade do zero
+        self._archive_resolved_quests()
+        self._rebuild_location_index()
+        self.availability.invalidate()
+
     def reset_game_state(self):
         self.current_turn = 1
         self.active_quests = {}
         self.completed_quests = defaultdict(set)
         self.failed_quests = set()
         self.procedural_pool = {}
+        self.archived_quests = set()
+        self._reconstructed.clear()
 
         for quest in self.quests:
             quest.available_since_turn = None
 
-    def _get_latest_quest_in_location(self, sub_location_key):
-        latest_turn = -1
-        latest_quest = None
+        self._rebuild_location_index()
+        self.availability.invalidate()
 
-        for quest in self.quest_registry.values():
-            if quest.id in self.completed_quests or quest.id in self.failed_quests:
-                continue
+    def _location_quests(self, sub_location_key) -> list:
+        """Quests não resolvidas na sub-localização, na ordem de registro."""
+        bucket = self._location_index.get(sub_location_key)
+        if not bucket:
+            return []
 
-            if quest.context.get("sub_location_key", "") != sub_location_key:
+        quests = []
+        for qid in list(bucket):
+            quest = self.quest_registry.get(qid)
+            if quest is None or self._is_resolved(qid):
+                del bucket[qid]  # saiu do jogo por um caminho sem hook
                 continue
+            quests.append(quest)
+        return quests
+
+    def _get_latest_quest_in_location(self, sub_location_key):
+        latest_turn = -1
+        latest_quest = None
 
+        for quest in self._location_quests(sub_location_key):
             start = getattr(quest, "available_since_turn", 0)
             duration = getattr(quest, "duration", 1)
             end = start + duration
@@ -449,10 +597,32 @@ class QuestManager:
 
         return latest_quest, latest_turn
 
-    def _generate_new_procedural(self) -> Quest:
-        avg_lvl = self._get_average_hero_level()
-        quest = self.proc_gen.generate_quest_of_type("fight", avg_lvl)
+    def _generate_procedural_batch(self, count: int) -> list:
+        """
+        Gera e registra até `count` quests do turno, com seeds inéditas.
+        Cada uma já entra no índice de localização antes da próxima ser
+        agendada; para na primeira que a fila da localização segurar.
+        """
+        if count <= 0:
+            return []
 
+        avg_lvl = self._get_average_hero_level()
+        known_ids = _KnownQuestIds(self.quest_registry, self.archived_quests)
+        generated = []
+
+        try:
+            for quest in self.proc_gen.generate_batch(count, "fight", avg_lvl, exclude=known_ids):
+                if not self._schedule_procedural(quest):
+                    break
+                self._register_quest(quest)
+                generated.append(quest)
+        except ValueError as e:
+            print(f"⚠️ Geração procedural interrompida: {e}")
+
+        return generated
+
+    def _schedule_procedural(self, quest) -> bool:
+        """Define quando a quest abre; False se a fila da sub-localização está cheia."""
         location = quest.context.get("sub_location_key", "")
 
         latest_quest, latest_end = self._get_latest_quest_in_location(location)
@@ -465,22 +635,10 @@ class QuestManager:
 
         queue_size = self._count_queued_in_location(location)
 
-        if queue_size >= 3:
-            return None  # 👈 segura geração
-
-        return quest
+        return queue_size < 3
 
     def _count_queued_in_location(self, sub_location_key):
-        count = 0
-
-        for quest in self.quest_registry.values():
-            if quest.id in self.completed_quests or quest.id in self.failed_quests:
-                continue
-
-            if quest.context.get("sub_location_key", "") != sub_location_key:
-                continue
-
-            if getattr(quest, "available_since_turn", 0) > self.current_turn:
-                count += 1
-
-        return count
\ No newline at end of file
+        return sum(
+            1 for quest in self._location_quests(sub_location_key)
+            if getattr(quest, "available_since_turn", 0) > self.current_turn
+        )
@@ -6,44 +6,33 @@ def check_available_turn(quest, manager) -> bool:
 
 
 def check_required_quests(quest, manager) -> bool:
-    required_quests = getattr(quest, "required_quests", [])
-    forbidden_quests = getattr(quest, "forbidden_quests", [])
+    required_clauses = getattr(quest, "required_clauses", ())
+    required_ids = getattr(quest, "required_ids", frozenset())
+    forbidden_ids = getattr(quest, "forbidden_ids", frozenset())
     required_perks = getattr(quest, "required_perks", [])
     forbidden_heroes = getattr(quest, "forbidden_heroes", [])
+    completed_quests = manager.completed_quests
 
     # 1 — Verifica se required_quests foram concluídas
-    if required_quests:
-        quest_requirement_met = False
-
-        for req in required_quests:
-            req_str = str(req).strip()
-
-            # AND → "10_12_15"
-            if "_" in req_str:
-                ids_needed = [int(qid) for qid in req_str.split("_")]
-                if all(qid in manager.completed_quests for qid in ids_needed):
-                    quest_requirement_met = True
-
-            # OR → simples "10"
-            else:
-                if int(req_str) in manager.completed_quests:
-                    quest_requirement_met = True
-
-        if not quest_requirement_met:
+    # Cada cláusula é um AND ("10_12_15"); basta uma cláusula satisfeita (OR)
+    if required_clauses:
+        if not any(
+            all(qid in completed_quests for qid in clause)
+            for clause in required_clauses
+        ):
             return False
 
     # 2 — Forbidden Quests
-    for fquest in forbidden_quests:
-        if int(fquest) in manager.completed_quests:
-            return False
+    if any(qid in completed_quests for qid in forbidden_ids):
+        return False
 
     # 3 — Required Perks (NOVA LÓGICA)
     if required_perks:
         completed_by_all = set()
 
         # Coleta todos os heróis que completaram as quests requeridas
-        for req in required_quests:
-            completed_by_all |= manager.completed_quests.get(req, set())
+        for req in required_ids:
+            completed_by_all |= completed_quests.get(req, set())
 
         perk_met = False
 
@@ -63,8 +52,8 @@ def check_required_quests(quest, manager) -> bool:
 
     # 4 — Forbidden Heroes (mantido como está)
     if forbidden_heroes:
-        for req in required_quests:
-            completed_by = manager.completed_quests.get(req, set())
+        for req in required_ids:
+            completed_by = completed_quests.get(req, set())
             for forbidden_id in forbidden_heroes:
                 if forbidden_id in completed_by:
                     return False
@@ -74,10 +63,10 @@ def check_required_quests(quest, manager) -> bool:
 
 def check_trigger_on_fail(quest, manager) -> bool:
     """Verifica se a quest é liberada apenas se outras falharem."""
-    trigger = getattr(quest, "trigger_on_fail", [])
-    if not trigger:
+    trigger_ids = getattr(quest, "trigger_ids", frozenset())
+    if not trigger_ids:
         return True  # não depende de falha
-    return any(failed in manager.failed_quests for failed in trigger)
+    return any(failed in manager.failed_quests for failed in trigger_ids)
 
 
 def check_not_completed(quest, manager) -> bool:
@@ -102,9 +91,10 @@ def check_not_active(quest, manager) -> bool:
 
 
 def process_expired_quests(manager):
-    """Processa a lista inteira e move quests expiradas para failed."""
+    """Processa as quests pendentes e move as expiradas para failed."""
     expired = []
-    for quest in manager.quest_registry.values():
+    # Só as quests pendentes podem expirar — as já resolvidas ficam de fora
+    for quest in manager.availability.pending_quests():
         if quest.id in manager.active_quests or \
            quest.id in manager.completed_quests or \
            quest.id in manager.failed_quests:
@@ -112,6 +102,7 @@ def process_expired_quests(manager):
 
         if quest.is_expired(manager.current_turn):
             manager.failed_quests.add(quest.id)
+            manager._on_quest_resolved(quest)
             expired.append(quest)
             manager._log(manager.lm.t("quest_expired").format(quest=quest.name))
 
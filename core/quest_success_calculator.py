@@ -1,9 +1,15 @@
 # quest_success_calculator.py
 
 import random
+from itertools import chain, combinations
+
 from core.hero import Hero
 from core.quest import Quest
-from core.language_manager import LanguageManager
+
+try:
+    import numpy as np
+except ImportError:  # numpy vem do requirements.txt; sem ele o lote roda em Python puro
+    np = None
 
 
 PERK_ATTRIBUTE_MAP = {
@@ -36,6 +42,9 @@ PERK_ATTRIBUTE_MAP = {
     "athletics": "strength",     # atletismo
 }
 
+# Roles contadas na sinergia de fight (colunas da matriz de roles)
+PARTY_ROLES = ("tank", "healer", "dps")
+
 class QuestSuccessCalculator:
     def __init__(self, language_manager=None):
         """
@@ -53,23 +62,20 @@ class QuestSuccessCalculator:
         # 🔥 COMBATE
         if "fight" in quest_types:
             for hero in heroes:
-                best_combat = max(
-                    hero.stats.get(attr, 0)
-                    for attr in ["strength", "dexterity", "intelligence", "wisdom"]
-                )
-                total_rating += best_combat
+                total_rating += max(hero.stat_values)
 
         # 🧠 SKILL / PERK
         else:
             for hero in heroes:
                 best_value = 0
+                stats = hero.stats
                 for perk in getattr(hero, "perks", []):
                     if perk not in quest_types:
                         continue
                     attribute = PERK_ATTRIBUTE_MAP.get(perk)
                     if not attribute:
                         continue
-                    value = hero.stats.get(attribute, 0)
+                    value = stats.get(attribute, 0)
                     best_value = max(best_value, value)
                 total_rating += best_value
 
@@ -166,12 +172,177 @@ class QuestSuccessCalculator:
 
         return max(0.05, min(0.95, base_chance))
 
+    # ═══════════════════════════════════════
+    # 📊 LOTE: TODAS AS PARTIES DE UMA VEZ
+    # ═══════════════════════════════════════
+    #
+    # Mesmas regras de calculate_success_chance, mas cada herói vira uma
+    # linha (rating, roles, skills cobertas) e cada tamanho de party é
+    # avaliado de uma vez sobre a matriz de combinações. Com numpy as
+    # regras viram operações de array; sem ele, o mesmo cálculo em Python.
+
+    def evaluate_parties(self, heroes: list["Hero"], quest: "Quest") -> list[tuple[tuple["Hero", ...], float]]:
+        """
+        Chance de sucesso de todas as parties possíveis com `heroes` (1 até
+        quest.max_heroes heróis), em ordem de tamanho e depois de combinação.
+        """
+        heroes = list(heroes)
+        results = []
+        for combos, chances in self._score_parties(heroes, quest):
+            for combo, chance in zip(combos, chances):
+                results.append((tuple(heroes[i] for i in combo), float(chance)))
+        return results
+
+    def best_party(self, heroes: list["Hero"], quest: "Quest") -> tuple[list["Hero"], float]:
+        """
+        Party com a maior chance entre todas as combinações de `heroes`.
+        No empate vence a menor (libera heróis). Sem heróis: ([], 0.0).
+        """
+        heroes = list(heroes)
+        best, best_chance = None, -1.0
+
+        for combos, chances in self._score_parties(heroes, quest):
+            if np is not None:
+                index = int(np.argmax(chances))
+            else:
+                index = max(range(len(chances)), key=chances.__getitem__)
+            if chances[index] > best_chance:
+                best, best_chance = combos[index], float(chances[index])
+
+        if best is None:
+            return [], 0.0
+        return [heroes[i] for i in best], best_chance
+
+    def _score_parties(self, heroes: list["Hero"], quest: "Quest"):
+        """Gera (combinações, chances) por tamanho de party; combinações são índices em heroes."""
+        quest_types = quest.type if isinstance(quest.type, list) else [quest.type]
+        is_fight = "fight" in quest_types
+        party_size = quest.max_heroes
+        divisor = quest.difficulty * 2
+
+        required_skills = [t for t in quest_types if t != "fight"]
+        skill_synergy = not is_fight and len(required_skills) >= 2 and party_size >= 2
+        skill_bits = {skill: 1 << bit for bit, skill in enumerate(dict.fromkeys(required_skills))}
+        full_mask = (1 << len(skill_bits)) - 1
+
+        # Uma linha por herói: rating, roles (one-hot) e skills cobertas (bitmask)
+        ratings, roles, masks = [], [], []
+        for hero in heroes:
+            if is_fight:
+                ratings.append(max(hero.stat_values))
+            else:
+                best_value = 0
+                stats = hero.stats
+                for perk in getattr(hero, "perks", []):
+                    if perk not in quest_types:
+                        continue
+                    attribute = PERK_ATTRIBUTE_MAP.get(perk)
+                    if attribute:
+                        best_value = max(best_value, stats.get(attribute, 0))
+                ratings.append(best_value)
+
+            role = getattr(hero, "role", None)
+            roles.append(tuple(int(role == name) for name in PARTY_ROLES))
+
+            perks = set(getattr(hero, "perks", []))
+            mask = 0
+            for skill, bit in skill_bits.items():
+                if skill in perks:
+                    mask |= bit
+            masks.append(mask)
+
+        if np is not None:
+            ratings = np.asarray(ratings, dtype=np.float64)
+            roles = np.asarray(roles, dtype=np.int64).reshape(len(heroes), len(PARTY_ROLES))
+            masks = np.asarray(masks, dtype=np.int64)
+
+        # Sem numpy: cada party estende as da rodada anterior, carregando os
+        # agregados (rating, roles, skills) em vez de somar tudo de novo
+        frontier = [((), 0, 0, 0, 0, 0)]
+
+        for size in range(1, min(party_size, len(heroes)) + 1):
+            hit, miss = self._synergy_factors(size, party_size, is_fight, skill_synergy, len(required_skills))
+
+            if np is not None:
+                combos = np.fromiter(
+                    chain.from_iterable(combinations(range(len(heroes)), size)), dtype=np.intp,
+                ).reshape(-1, size)
+                base = ratings[combos].sum(axis=1) / divisor
+                if is_fight:
+                    tank, healer, dps = roles[combos].sum(axis=1).T
+                    ok = self._has_core(party_size, tank, healer, dps)
+                else:
+                    ok = np.bitwise_or.reduce(masks[combos], axis=1) == full_mask
+                chances = np.clip(base * np.where(ok, hit, miss), 0.05, 0.95)
+            else:
+                frontier = [
+                    (combo + (i,), total + ratings[i], tank + roles[i][0],
+                     healer + roles[i][1], dps + roles[i][2], covered | masks[i])
+                    for combo, total, tank, healer, dps, covered in frontier
+                    for i in range(combo[-1] + 1 if combo else 0, len(heroes))
+                ]
+                combos = [entry[0] for entry in frontier]
+                chances = []
+                for _, total, tank, healer, dps, covered in frontier:
+                    if is_fight:
+                        ok = self._has_core(party_size, tank, healer, dps)
+                    else:
+                        ok = covered == full_mask
+                    chances.append(max(0.05, min(0.95, total / divisor * (hit if ok else miss))))
+
+            yield combos, chances
+
+    @staticmethod
+    def _has_core(party_size: int, tank, healer, dps):
+        """Composição mínima de fight; aceita contagens escalares ou arrays."""
+        if party_size >= 4:
+            return (tank >= 1) & (healer >= 1) & (dps >= 2)
+        if party_size == 3:
+            return (tank >= 1) & (healer >= 1) & (dps >= 1)
+        if party_size == 2:
+            return ((tank >= 1) | (healer >= 1)) & (dps >= 1)
+        return True  # solo: nada pra checar
+
+    @staticmethod
+    def _synergy_factors(size: int, party_size: int, is_fight: bool,
+                         skill_synergy: bool, n_skills: int) -> tuple[float, float]:
+        """
+        Multiplicador de sinergia de uma party de `size` heróis, com e sem a
+        composição certa (roles em fight, cobertura das skills nas demais).
+        """
+        hit = miss = 1.0
+        missing = party_size - size
+
+        if is_fight:
+            hit *= 1.15
+            miss *= 0.85
+            if missing > 0:
+                hit *= (0.92 ** missing)
+                miss *= (0.92 ** missing)
+
+        elif skill_synergy:
+            if party_size == 2 and n_skills == 2:
+                if size == 1:
+                    hit *= 0.80
+                    miss *= 0.70
+                else:
+                    hit *= 1.10
+                    miss *= 0.75
+            else:
+                hit *= 1.10
+                miss *= 0.90
+
+            if missing > 0:
+                hit *= (0.95 ** missing)
+                miss *= (0.95 ** missing)
+
+        return hit, miss
+
 def run_mission_roll(success_chance: float) -> str:
     """
     Simula uma rolagem de dados e retorna o resultado traduzido:
     'critical', 'success', 'failure' ou 'critical_failure'.
     """
-    lm = LanguageManager()  # lê o idioma atual
     roll = random.random()
 
     # 🔹 Determina resultado “interno” (em inglês, padrão de chave)
@@ -199,16 +370,29 @@ def calculate_success_chance(heroes: list[Hero], quest: Quest, language_manager=
     return _global_calculator.calculate_success_chance(heroes, quest)
 
 
+def find_best_party(heroes: list[Hero], quest: Quest) -> tuple[list[Hero], float]:
+    """Melhor party entre `heroes` para a quest (ver QuestSuccessCalculator.best_party)."""
+    global _global_calculator
+    if _global_calculator is None:
+        _global_calculator = QuestSuccessCalculator()
+    return _global_calculator.best_party(heroes, quest)
+
+
 if __name__ == "__main__":
     # Teste
     from unittest.mock import Mock
     
-    hero = Mock()
-    hero.stats = {"strength": 1, "dexterity": 4, "intelligence": 1, "wisdom": 1}
+    hero = Hero(
+        id=0, name="Teste", last_name="", role="dps", hero_class="", status="idle",
+        perks=[], defects=[], story="", photo_url="", photo_body_url="",
+        unlock_by_quest=[], available_from_turn=None, leave_on_quest=[],
+        growth_curve={"1": {"strength": 1, "dexterity": 4, "intelligence": 1, "wisdom": 1}},
+    )
     
     quest = Mock()
     quest.type = "strength"  # em português
     quest.difficulty = 1.5
+    quest.max_heroes = 1
     
     # Teste sem LanguageManager
     print("=== Teste sem LanguageManager ===")
@@ -219,6 +403,7 @@ if __name__ == "__main__":
     quest2 = Mock()
     quest2.type = "fight"  # em português
     quest2.difficulty = 0.4005
+    quest2.max_heroes = 1
     
     # Teste sem LanguageManager
     print("=== Teste sem LanguageManager ===")
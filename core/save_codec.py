@@ -0,0 +1,256 @@
+# ════════════════════════════════════════════════════════════════
+# 🗜️ SAVE_CODEC.PY - FORMATO BINÁRIO COMPACTO DOS SAVES
+# ════════════════════════════════════════════════════════════════
+#
+# Converte o dicionário de save_manager.build_save_data() em bytes e
+# de volta. O formato é escolhido pelo cabeçalho do arquivo, então saves
+# JSON antigos continuam carregando e viram binários no próximo save.
+#
+# Layout binário (little-endian):
+#   MAGIC "GQSV" | versão u16 | flags u16 | corpo (zlib se FLAG_ZLIB)
+#
+# Corpo, versão 1:
+#   turno i64
+#   tabela de strings (status dos heróis)
+#   heróis: ids, xp, índice do status
+#   heróis desbloqueados, quests falhadas
+#   quests completadas: ids, nº de heróis por quest, ids dos heróis
+#   quests ativas: ids, turns_left, nº de heróis, ids dos heróis
+#   disponibilidade: ids, turno
+#
+# Cada lista de inteiros é um u32 com o tamanho seguido de um array
+# empacotado (array.array) — ids procedurais são seeds de 15 dígitos,
+# por isso i64.
+#
+# ════════════════════════════════════════════════════════════════
+
+import json
+import struct
+import sys
+import zlib
+from array import array
+
+MAGIC = b"GQSV"
+VERSION = 1
+FLAG_ZLIB = 0x1
+
+_HEADER = struct.Struct("<4sHH")
+_COUNT = struct.Struct("<I")
+_INT64 = struct.Struct("<q")
+_STR_LEN = struct.Struct("<H")
+
+COMPRESS_MIN_SIZE = 512  # abaixo disso o zlib não compensa
+ZLIB_LEVEL = 1           # autosave a cada turno: velocidade > último byte
+
+CODECS = ("binary", "json")
+
+
+# ════════════════════════════════════════════════════════════════
+# API
+# ════════════════════════════════════════════════════════════════
+
+def encode_save(data: dict, codec: str = "binary", compress: bool = True) -> bytes:
+    """
+    Serializa o save no codec pedido.
+
+    Se o estado não cabe no schema binário (ex.: ID de quest não numérico),
+    cai para JSON — que continua sendo lido normalmente.
+    """
+    if codec not in CODECS:
+        raise ValueError(f"Codec de save desconhecido: {codec}")
+
+    if codec == "binary":
+        try:
+            return _encode_binary(data, compress)
+        except (ValueError, TypeError, OverflowError, struct.error) as e:
+            print(f"⚠️  Save binário indisponível ({e}) - usando JSON")
+
+    return json.dumps(data, indent=4, ensure_ascii=False).encode("utf-8")
+
+
+def decode_save(raw: bytes) -> dict:
+    """Lê um save em qualquer formato suportado, detectado pelo cabeçalho."""
+    if is_binary_save(raw):
+        return _decode_binary(raw)
+    return json.loads(raw.decode("utf-8"))
+
+
+def is_binary_save(raw: bytes) -> bool:
+    return raw[:len(MAGIC)] == MAGIC
+
+
+# ════════════════════════════════════════════════════════════════
+# ESCRITA
+# ════════════════════════════════════════════════════════════════
+
+def _encode_binary(data: dict, compress: bool) -> bytes:
+    out = bytearray()
+
+    out += _INT64.pack(int(data.get("current_turn", 0)))
+
+    heroes = data.get("heroes", [])
+    statuses = sorted({str(hero.get("status", "idle")) for hero in heroes})
+    status_index = {status: i for i, status in enumerate(statuses)}
+
+    # array("q") recusa floats/strings: o que não for inteiro cai para JSON.
+    # As chaves de quest vêm como str (igual ao JSON), daí o int() nelas.
+    _write_strings(out, statuses)
+    _write_ints(out, "q", [hero["id"] for hero in heroes])
+    _write_ints(out, "q", [hero.get("xp", 0) for hero in heroes])
+    _write_ints(out, "H", [status_index[str(hero.get("status", "idle"))] for hero in heroes])
+
+    _write_ints(out, "q", data.get("unlocked_heroes", []))
+    _write_ints(out, "q", data.get("failed_quests", []))
+
+    completed = data.get("completed_quests", {})
+    _write_ints(out, "q", map(int, completed))
+    _write_ints(out, "I", [len(hids) for hids in completed.values()])
+    _write_ints(out, "q", [hid for hids in completed.values() for hid in hids])
+
+    active = data.get("active_quests", {})
+    _write_ints(out, "q", map(int, active))
+    _write_ints(out, "q", [entry.get("turns_left", 0) for entry in active.values()])
+    _write_ints(out, "I", [len(entry.get("heroes", [])) for entry in active.values()])
+    _write_ints(out, "q", [hid for entry in active.values() for hid in entry.get("heroes", [])])
+
+    availability = data.get("quests_availability", {})
+    _write_ints(out, "q", map(int, availability))
+    _write_ints(out, "q", availability.values())
+
+    body = bytes(out)
+    flags = 0
+    if compress and len(body) >= COMPRESS_MIN_SIZE:
+        packed = zlib.compress(body, ZLIB_LEVEL)
+        if len(packed) < len(body):
+            body, flags = packed, FLAG_ZLIB
+
+    return _HEADER.pack(MAGIC, VERSION, flags) + body
+
+
+def _write_ints(out: bytearray, typecode: str, values):
+    packed = array(typecode, values)
+    if sys.byteorder != "little":
+        packed.byteswap()
+    out += _COUNT.pack(len(packed))
+    out += packed.tobytes()
+
+
+def _write_strings(out: bytearray, strings: list):
+    out += _COUNT.pack(len(strings))
+    for text in strings:
+        encoded = text.encode("utf-8")
+        out += _STR_LEN.pack(len(encoded))
+        out += encoded
+
+
+# ════════════════════════════════════════════════════════════════
+# LEITURA
+# ════════════════════════════════════════════════════════════════
+
+class _Reader:
+    def __init__(self, buffer: bytes):
+        self.buffer = memoryview(buffer)
+        self.offset = 0
+
+    def unpack(self, fmt: struct.Struct):
+        values = fmt.unpack_from(self.buffer, self.offset)
+        self.offset += fmt.size
+        return values
+
+    def ints(self, typecode: str) -> list:
+        (count,) = self.unpack(_COUNT)
+        values = array(typecode)
+        size = count * values.itemsize
+        if self.offset + size > len(self.buffer):
+            raise ValueError("save binário truncado")
+        values.frombytes(self.buffer[self.offset:self.offset + size])
+        self.offset += size
+        if sys.byteorder != "little":
+            values.byteswap()
+        return values.tolist()
+
+    def strings(self) -> list:
+        (count,) = self.unpack(_COUNT)
+        result = []
+        for _ in range(count):
+            (length,) = self.unpack(_STR_LEN)
+            result.append(bytes(self.buffer[self.offset:self.offset + length]).decode("utf-8"))
+            self.offset += length
+        return result
+
+
+def _split(flat: list, counts: list) -> list:
+    groups, start = [], 0
+    for count in counts:
+        groups.append(flat[start:start + count])
+        start += count
+    return groups
+
+
+def _decode_binary(raw: bytes) -> dict:
+    try:
+        magic, version, flags = _HEADER.unpack_from(raw, 0)
+    except struct.error:
+        raise ValueError("cabeçalho de save truncado")
+
+    if magic != MAGIC:
+        raise ValueError("não é um save binário")
+    if version > VERSION:
+        raise ValueError(f"save na versão {version}; este jogo lê até a {VERSION}")
+
+    body = raw[_HEADER.size:]
+    if flags & FLAG_ZLIB:
+        try:
+            body = zlib.decompress(body)
+        except zlib.error as e:
+            raise ValueError(f"save binário corrompido: {e}")
+
+    try:
+        return _decode_body_v1(_Reader(body))
+    except struct.error as e:
+        raise ValueError(f"save binário truncado: {e}")
+
+
+def _decode_body_v1(reader: _Reader) -> dict:
+    """Monta o mesmo dicionário que o JSON teria — load_game não distingue os formatos."""
+    (current_turn,) = reader.unpack(_INT64)
+
+    statuses = reader.strings()
+    hero_ids = reader.ints("q")
+    hero_xp = reader.ints("q")
+    hero_status = reader.ints("H")
+
+    unlocked = reader.ints("q")
+    failed = reader.ints("q")
+
+    completed_ids = reader.ints("q")
+    completed_counts = reader.ints("I")
+    completed_heroes = _split(reader.ints("q"), completed_counts)
+
+    active_ids = reader.ints("q")
+    active_turns = reader.ints("q")
+    active_counts = reader.ints("I")
+    active_heroes = _split(reader.ints("q"), active_counts)
+
+    availability_ids = reader.ints("q")
+    availability_turns = reader.ints("q")
+
+    return {
+        "current_turn": current_turn,
+        "completed_quests": {
+            str(qid): hids for qid, hids in zip(completed_ids, completed_heroes)
+        },
+        "failed_quests": failed,
+        "unlocked_heroes": unlocked,
+        "heroes": [
+            {"id": hid, "xp": xp, "status": statuses[status]}
+            for hid, xp, status in zip(hero_ids, hero_xp, hero_status)
+        ],
+        "active_quests": {
+            str(qid): {"turns_left": turns_left, "heroes": hids}
+            for qid, turns_left, hids in zip(active_ids, active_turns, active_heroes)
+        },
+        "quests_availability": {
+            str(qid): turn for qid, turn in zip(availability_ids, availability_turns)
+        },
+    }
@@ -2,15 +2,97 @@
 # 💾 SAVE_MANAGER.PY - COM SUPORTE A QUESTS PROCEDURAIS
 # ════════════════════════════════════════════════════════════════
 
+import atexit
+import hashlib
 import json
 import os
+import shutil
+import threading
+import time
+
+from core import save_codec
+from core.save_codec import encode_save, decode_save
 
 SAVE_DIR = "saves"
+SAVE_FORMAT = "binary"  # "binary" (core/save_codec.py) ou "json"; a leitura aceita os dois
+# Extensão de cada formato: save binário não se passa por .json
+SAVE_EXTENSIONS = {"binary": ".gqsv", "json": ".json"}
+SAVE_SUFFIXES = tuple(SAVE_EXTENSIONS.values())
+BACKUP_COUNT = 3  # cópias anteriores por slot: <save>.bak1 (mais nova) … .bakN
+
+# Índice com os metadados de cada slot (extensão fora de SAVE_SUFFIXES: não é um save)
+SAVE_INDEX_FILE = "saves.index"
+INDEX_VERSION = 2  # 2: entradas com "stamp" (tamanho, mtime) e saves ilegíveis marcados
+
+# Serializa escritas em disco (save manual x autosave no mesmo arquivo) e o índice
+_write_lock = threading.RLock()
+_last_written = {}  # {path: hash do conteúdo gravado} — pula escritas idênticas
+_generations = {}   # {path: n} — cada save manual incrementa; snapshots mais velhos não gravam
+_indexes = {}       # {diretório: {arquivo: metadados}} — cópia em memória do índice
+
 
 def save_game(manager, filename):
-    os.makedirs(SAVE_DIR, exist_ok=True)
-    path = os.path.join(SAVE_DIR, filename)
-    
+    """Save síncrono — usado no save manual, que precisa estar no disco na hora."""
+    path = _save_path(filename)
+    data = build_save_data(manager)
+
+    # Autosaves deste arquivo tirados antes daqui (na fila ou já sendo
+    # serializados) ficam com geração velha e não sobrescrevem este save
+    with _write_lock:
+        generation = _generations[path] = _generations.get(path, 0) + 1
+    get_autosave_worker().cancel(path)
+    _write_save_file(path, data, generation)
+
+
+def save_game_async(manager, filename):
+    """
+    Autosave: tira o snapshot aqui (thread principal, barato) e deixa a
+    serialização e a escrita para a thread de fundo.
+    """
+    path = _save_path(filename)
+    with _write_lock:
+        generation = _generations.get(path, 0)
+    get_autosave_worker().submit(path, build_save_data(manager), generation)
+
+
+def save_slot_name(filename) -> str:
+    """Nome do slot sem extensão ("slot.gqsv" / "slot.json" → "slot")."""
+    name = os.path.basename(filename)
+    for suffix in SAVE_SUFFIXES:
+        if name.endswith(suffix):
+            return name[:-len(suffix)]
+    return name
+
+
+def _save_path(filename, directory=None) -> str:
+    """Onde o slot é gravado: extensão do SAVE_FORMAT atual, qualquer que seja a pedida."""
+    return os.path.join(directory or SAVE_DIR, save_slot_name(filename) + SAVE_EXTENSIONS[SAVE_FORMAT])
+
+
+def _slot_paths(filename, directory=None) -> list[str]:
+    """Caminhos possíveis do slot: o nome pedido e depois o slot em cada formato."""
+    directory = directory or SAVE_DIR
+    slot = save_slot_name(filename)
+    paths = [os.path.join(directory, filename)]
+    paths += [os.path.join(directory, slot + suffix) for suffix in SAVE_SUFFIXES]
+    return list(dict.fromkeys(paths))
+
+
+def _find_save(filename, directory=None):
+    """Caminho do arquivo existente do slot, em qualquer formato; None se não há."""
+    for path in _slot_paths(filename, directory):
+        if os.path.isfile(path):
+            return path
+    return None
+
+
+def flush_saves(timeout=None) -> bool:
+    """Espera os autosaves pendentes chegarem ao disco (saída, menu, load)."""
+    return get_autosave_worker().flush(timeout)
+
+
+def build_save_data(manager) -> dict:
+    """Snapshot do estado só com tipos simples — seguro para outra thread serializar."""
     # ════════════════════════════════════════════════════════════
     # QUESTS ATIVAS (handcrafted + procedural)
     # ════════════════════════════════════════════════════════════
@@ -59,23 +141,374 @@ def save_game(manager, filename):
         "quests_availability": quests_availability,
         
     }
-    
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=4, ensure_ascii=False)
-    
+
+    return data
+
+
+def _write_save_file(path, data, generation=None):
+    """
+    Escrita à prova de crash: grava em <save>.tmp, faz fsync e só então
+    troca pelo arquivo real com os.replace (atômico). A versão anterior
+    fica em .bak1 (hard link) e as demais andam uma posição; o save
+    principal existe o tempo todo.
+
+    `generation` é a de _generations quando o snapshot foi tirado: se um
+    save manual veio depois, a escrita é descartada.
+    """
+    content = encode_save(data, SAVE_FORMAT)
+    digest = hashlib.sha1(content).digest()
+
+    with _write_lock:
+        if generation is not None and generation < _generations.get(path, 0):
+            return  # snapshot mais velho que um save manual já gravado
+        if _last_written.get(path) == digest and os.path.exists(path):
+            return  # nada mudou desde a última escrita
+
+        directory = os.path.dirname(path) or "."
+        os.makedirs(directory, exist_ok=True)
+
+        _adopt_other_format(path)
+        _atomic_write(path, content, rotate=True)
+        _last_written[path] = digest
+
+        entry = _index_entry(data, content, _file_stamp(path))
+        _update_index(directory, os.path.basename(path), entry)
+
     print(f"💾 Jogo salvo em: {path}")
-    
+
+
+def _atomic_write(path, content: bytes, rotate=False):
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(content)
+        f.flush()
+        os.fsync(f.fileno())
+
+    if rotate:
+        _rotate_backups(path)
+    os.replace(tmp_path, path)
+    _fsync_dir(os.path.dirname(path) or ".")
+
+
+def _adopt_other_format(path):
+    """
+    Slot gravado antes em outro formato (ex.: slot.json de versões antigas):
+    o arquivo e os backups passam para os nomes de `path`, e a rotação
+    normal os guarda como backups. Evita dois arquivos para o mesmo slot.
+    """
+    if os.path.exists(path):
+        return
+
+    for old_path in _slot_paths(os.path.basename(path), os.path.dirname(path) or "."):
+        if old_path == path or not os.path.isfile(old_path):
+            continue
+        for old, new in zip([old_path] + _backup_paths(old_path), [path] + _backup_paths(path)):
+            if os.path.exists(old):
+                os.replace(old, new)
+        _last_written.pop(old_path, None)
+        return
+
+
+def _backup_paths(path) -> list[str]:
+    return [f"{path}.bak{n}" for n in range(1, BACKUP_COUNT + 1)]
+
+
+def _rotate_backups(path):
+    """
+    Anda os backups uma posição e deixa em .bak1 um hard link (ou cópia)
+    do save atual. O arquivo principal nunca sai do lugar: só é trocado
+    depois, pelo os.replace do .tmp.
+    """
+    if BACKUP_COUNT <= 0 or not os.path.exists(path):
+        return
+
+    backups = _backup_paths(path)
+    for older, newer in zip(reversed(backups), reversed(backups[:-1])):
+        if os.path.exists(newer):
+            os.replace(newer, older)
+    if os.path.exists(backups[0]):  # BACKUP_COUNT == 1: nada andou
+        os.remove(backups[0])
+
+    try:
+        os.link(path, backups[0])
+    except OSError:  # sistema de arquivos sem hard links
+        shutil.copy2(path, backups[0])
+
+
+def _fsync_dir(directory):
+    """Persiste a renomeação no diretório (POSIX). No Windows não há o que fazer."""
+    if not hasattr(os, "O_DIRECTORY"):
+        return
+    try:
+        fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _read_save_data(filename, directory=None):
+    """
+    Lê um save (em qualquer formato/extensão do slot); se o arquivo principal
+    faltar ou estiver corrompido, usa o backup válido mais recente.
+    Retorna (data, path) ou (None, None).
+    """
+    paths = _slot_paths(filename, directory)
+    candidates = [candidate for path in paths for candidate in [path] + _backup_paths(path)]
+
+    for candidate in candidates:
+        if not os.path.isfile(candidate):
+            continue
+        try:
+            with open(candidate, "rb") as f:
+                data = decode_save(f.read())
+        except (OSError, ValueError) as e:
+            print(f"⚠️  Save '{candidate}' ilegível ({e}) - tentando backup")
+            continue
+        if not isinstance(data, dict):
+            print(f"⚠️  Save '{candidate}' inválido - tentando backup")
+            continue
+        if candidate not in paths:
+            print(f"♻️  Usando backup: {candidate}")
+        return data, candidate
+
+    return None, None
+
+
+# ════════════════════════════════════════════════════════════════
+# ÍNDICE DE SAVES
+# ════════════════════════════════════════════════════════════════
+#
+# saves/saves.index guarda turno, contagens, horário e formato de cada
+# slot. A tela de load e o menu leem só ele, sem abrir cada save.
+# Cada entrada guarda o "stamp" (tamanho, mtime_ns) do arquivo: se sumir,
+# for de outra versão ou não bater com os arquivos da pasta, só os saves
+# novos ou alterados são relidos. Saves ilegíveis ficam marcados
+# ("unreadable") para não serem relidos a cada consulta.
+
+def _summarize_save(data) -> dict:
+    # ✅ Conta procedurais também
+    procedural_count = (
+        len(data.get('procedural_available', [])) +
+        len(data.get('procedural_active', {})) +
+        len(data.get('procedural_completed', []))
+    )
+
+    return {
+        'turn': data.get('current_turn', 0),
+        'completed_quests': len(data.get('completed_quests', [])),
+        'active_quests': len(data.get('active_quests', {})),
+        'failed_quests': len(data.get('failed_quests', [])),
+        'procedural_quests': procedural_count,  # ✅ Novo
+    }
+
+
+def _index_entry(data, content: bytes, stamp, saved_at=None) -> dict:
+    entry = _summarize_save(data)
+    if save_codec.is_binary_save(content):
+        entry["format"], entry["version"] = "binary", save_codec.VERSION
+    else:
+        entry["format"], entry["version"] = "json", None
+    entry["saved_at"] = time.time() if saved_at is None else saved_at
+    entry["stamp"] = stamp
+    return entry
+
+
+def _file_stamp(path):
+    """[tamanho, mtime_ns] do arquivo (lista: volta igual do JSON do índice)."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+def _index_path(directory) -> str:
+    return os.path.join(directory, SAVE_INDEX_FILE)
+
+
+def _store_index(directory, entries):
+    content = json.dumps(
+        {"version": INDEX_VERSION, "saves": entries}, ensure_ascii=False
+    ).encode("utf-8")
+    _atomic_write(_index_path(directory), content)
+
+
+def _update_index(directory, filename, entry):
+    with _write_lock:
+        entries = _cached_index(directory)
+        entries[filename] = entry  # antes de validar: o save recém-gravado não é relido
+        _refresh_index(directory, entries)
+        _store_index(directory, entries)
+
+
+def _remove_from_index(directory, filename):
+    with _write_lock:
+        entries = _cached_index(directory)
+        removed = entries.pop(filename, None) is not None
+        if _refresh_index(directory, entries) or removed:
+            _store_index(directory, entries)
+
+
+def _load_index(directory) -> dict:
+    """Índice do diretório, validado contra os arquivos presentes na pasta."""
+    with _write_lock:
+        entries = _cached_index(directory)
+        if _refresh_index(directory, entries) and os.path.isdir(directory):
+            _store_index(directory, entries)
+        return entries
+
+
+def _cached_index(directory) -> dict:
+    """Índice em memória do diretório; lido do disco na primeira vez, sem validar."""
+    entries = _indexes.get(directory)
+    if entries is None:
+        entries = {}
+        try:
+            with open(_index_path(directory), "r", encoding="utf-8") as f:
+                stored = json.load(f)
+            if stored.get("version") == INDEX_VERSION:
+                entries = dict(stored.get("saves", {}))
+        except (OSError, ValueError, AttributeError):
+            pass  # sem índice (ou ilegível): _refresh_index reconstrói
+        _indexes[directory] = entries
+    return entries
+
+
+def _refresh_index(directory, entries) -> bool:
+    """
+    Acerta `entries` com a pasta: tira o que sumiu e relê só os saves novos
+    ou com stamp diferente. Retorna True se algo mudou.
+    """
+    try:
+        files = {f for f in os.listdir(directory) if f.endswith(SAVE_SUFFIXES)}
+    except OSError:
+        files = set()
+
+    changed = False
+    for filename in entries.keys() - files:
+        del entries[filename]
+        changed = True
+
+    for filename in files:
+        stamp = _file_stamp(os.path.join(directory, filename))
+        entry = entries.get(filename)
+        if entry is not None and entry.get("stamp") == stamp:
+            continue
+        entries[filename] = _scan_save(directory, filename, stamp)
+        changed = True
+
+    return changed
+
+
+def _scan_save(directory, filename, stamp):
+    """
+    Reconstrói a entrada do índice lendo o próprio save (índice ausente ou
+    arquivo alterado). Ilegível vira {"unreadable": True, "stamp": ...}.
+    """
+    data, path = _read_save_data(filename, directory)
+    if data is None:
+        return {"unreadable": True, "stamp": stamp}
+    with open(path, "rb") as f:
+        content = f.read(len(save_codec.MAGIC))
+    return _index_entry(data, content, stamp, saved_at=os.path.getmtime(path))
+
+
+def load_save_index() -> dict:
+    """Cópia dos metadados de todos os saves: {arquivo: {turn, ..., saved_at}}."""
+    with _write_lock:
+        return {
+            name: dict(entry)
+            for name, entry in _load_index(SAVE_DIR).items()
+            if not entry.get("unreadable")
+        }
+
+
+# ════════════════════════════════════════════════════════════════
+# AUTOSAVE EM SEGUNDO PLANO
+# ════════════════════════════════════════════════════════════════
+
+class AutosaveWorker:
+    """
+    Thread que grava os autosaves fora da thread da UI.
+
+    Só o snapshot mais recente de cada arquivo fica na fila: vários saves
+    seguidos enquanto o disco está ocupado viram uma única escrita.
+    """
+
+    def __init__(self):
+        self._pending = {}   # {path: (data, geração)}
+        self._writing = False
+        self._condition = threading.Condition()
+        self._thread = None
+        self.last_error = None
+
+    def submit(self, path, data, generation=None):
+        with self._condition:
+            self._pending[path] = (data, generation)
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name="autosave", daemon=True
+                )
+                self._thread.start()
+            self._condition.notify_all()
+
+    def cancel(self, path):
+        with self._condition:
+            self._pending.pop(path, None)
+
+    def flush(self, timeout=None) -> bool:
+        """Bloqueia até a fila esvaziar. Retorna False se o timeout estourar."""
+        with self._condition:
+            return self._condition.wait_for(
+                lambda: not self._pending and not self._writing, timeout
+            )
+
+    def _run(self):
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._pending)
+                path, (data, generation) = self._pending.popitem()
+                self._writing = True
+
+            try:
+                _write_save_file(path, data, generation)
+                self.last_error = None
+            except Exception as e:
+                self.last_error = e
+                print(f"❌ Erro no autosave '{path}': {e}")
+            finally:
+                with self._condition:
+                    self._writing = False
+                    self._condition.notify_all()
+
+
+_autosave_worker = None
+
+def get_autosave_worker():
+    """Retorna a instância global do AutosaveWorker."""
+    global _autosave_worker
+    if _autosave_worker is None:
+        _autosave_worker = AutosaveWorker()
+    return _autosave_worker
+
+
+# A thread é daemon: garante que o último autosave não se perca ao sair
+atexit.register(flush_saves)
+
 
 def load_game(manager, filename):
-    path = os.path.join(SAVE_DIR, filename)
+    flush_saves()
     
-    if not os.path.exists(path):
+    data, path = _read_save_data(filename)
+    if data is None:
         print(f"⚠️  Save '{filename}' não encontrado.")
         return False
     
-    with open(path, "r", encoding="utf-8") as f:
-        data = json.load(f)
-    
     manager.current_turn = data.get("current_turn", getattr(manager, "current_turn", 1))
     
     def _to_int_if_possible(x):
@@ -120,7 +553,7 @@ def load_game(manager, filename):
         except Exception:
             qid = qid_key
         
-        quest = manager.get_quest(qid)
+        quest = manager.restore_quest(qid)
         if quest is None:
             print(f"⚠️  Quest '{qid}' não existe - pulando")
             continue
@@ -149,7 +582,7 @@ def load_game(manager, filename):
         except Exception:
             qid = qid_key
         
-        quest = manager.get_quest(qid)
+        quest = manager.restore_quest(qid)
         if quest:
             if isinstance(turn_value, int):
                 quest.available_since_turn = turn_value
@@ -176,28 +609,30 @@ def load_game(manager, filename):
 # ════════════════════════════════════════════════════════════════
 
 def list_saves():
-    """Lista todos os arquivos de save disponíveis."""
+    """Lista todos os arquivos de save disponíveis, do mais recente ao mais antigo."""
     if not os.path.exists(SAVE_DIR):
         os.makedirs(SAVE_DIR)
         return []
     
-    files = [f for f in os.listdir(SAVE_DIR) if f.endswith('.json')]
-    
-    files.sort(
-        key=lambda f: os.path.getmtime(os.path.join(SAVE_DIR, f)),
-        reverse=True
-    )
-    
-    return files
+    entries = load_save_index()
+    return sorted(entries, key=lambda f: entries[f].get("saved_at", 0), reverse=True)
 
 
 def delete_save(filename):
-    """Deleta um arquivo de save."""
-    filepath = os.path.join(SAVE_DIR, filename)
+    """Deleta um save (o slot em qualquer formato, com os backups)."""
+    flush_saves()  # um autosave pendente recriaria o arquivo
+    filepaths = [path for path in _slot_paths(filename) if os.path.isfile(path)]
     
     try:
-        if os.path.exists(filepath):
-            os.remove(filepath)
+        if filepaths:
+            for filepath in filepaths:
+                os.remove(filepath)
+                with _write_lock:
+                    _last_written.pop(filepath, None)
+                for backup in _backup_paths(filepath):
+                    if os.path.exists(backup):
+                        os.remove(backup)
+                _remove_from_index(SAVE_DIR, os.path.basename(filepath))
             print(f"✅ Save '{filename}' deletado com sucesso")
             return True
         else:
@@ -209,27 +644,17 @@ def delete_save(filename):
 
 
 def get_save_info(filename):
-    """Obtém informações sobre um save."""
-    filepath = os.path.join(SAVE_DIR, filename)
-    
+    """Obtém informações sobre um save (do índice; só lê o arquivo se não estiver nele)."""
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
-        # ✅ Conta procedurais também
-        procedural_count = (
-            len(data.get('procedural_available', [])) +
-            len(data.get('procedural_active', {})) +
-            len(data.get('procedural_completed', []))
-        )
-        
-        return {
-            'turn': data.get('current_turn', 0),
-            'completed_quests': len(data.get('completed_quests', [])),
-            'active_quests': len(data.get('active_quests', {})),
-            'failed_quests': len(data.get('failed_quests', [])),
-            'procedural_quests': procedural_count,  # ✅ Novo
-        }
+        path = _find_save(filename)
+        entry = load_save_index().get(os.path.basename(path)) if path else None
+        if entry is not None:
+            return entry
+
+        data, _ = _read_save_data(filename)
+        if data is None:
+            return None
+        return _summarize_save(data)
     except Exception as e:
         print(f"Erro ao ler info do save '{filename}': {e}")
         return None
@@ -278,7 +703,7 @@ def load_state(self, state: dict):
     # ✅ RECONSTRÓI POOL DE PROCEDURAIS
     procedural_seeds = state.get("procedural_pool", [])
     for seed in procedural_seeds:
-        quest = self.get_quest(seed)  # Reconstrói da seed
+        quest = self.restore_quest(seed)  # Reconstrói da seed
         if quest:
             self.procedural_pool[seed] = quest
     
@@ -0,0 +1,354 @@
+# ════════════════════════════════════════════════════════════════
+# 🧪 SIMULATION.PY - LOOP DE TURNOS SEM INTERFACE
+# ════════════════════════════════════════════════════════════════
+#
+# Roda o QuestManager sem Kivy: uma política escolhe as parties,
+# advance_turn() é chamado N vezes e o tempo gasto em cada etapa
+# do turno é medido.
+#
+# Benchmark (a partir da raiz do projeto):
+#   python -m core.simulation --turns 150 --seeds 1 2 3 --policy greedy
+#
+# ════════════════════════════════════════════════════════════════
+
+import argparse
+import contextlib
+import os
+import random
+import shutil
+import tempfile
+import time
+import tracemalloc
+from collections import defaultdict
+
+import core.quest_manager as quest_manager_module
+import core.save_manager as save_manager
+from core.quest_gen import ProceduralQuestSystem
+from core.quest_success_calculator import QuestSuccessCalculator
+
+CHAPTER_TURN_LIMIT = 150  # mesmo limite do GameplayScreen.advance_turn
+
+SECTIONS = ("available_quests", "resolve_quest", "save_game", "procedural")
+
+
+@contextlib.contextmanager
+def _silenced():
+    """Descarta o stdout do jogo; o os.devnull é fechado na saída."""
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        yield
+
+
+# ════════════════════════════════════════════════════════════════
+# POLÍTICAS DE ESCALAÇÃO
+# ════════════════════════════════════════════════════════════════
+#
+# Assinatura: policy(manager, quests, heroes, rng) -> [(quest_id, [hero_ids])]
+# `quests` são as disponíveis no turno, `heroes` os heróis livres.
+
+def greedy_policy(manager, quests, heroes, rng):
+    """Preenche as quests na ordem do registro com o máximo de heróis possível."""
+    assignments = []
+    free = list(heroes)
+
+    for quest in quests:
+        if not free:
+            break
+        size = min(quest.max_heroes, len(free))
+        party, free = free[:size], free[size:]
+        assignments.append((quest.id, [hero.id for hero in party]))
+
+    return assignments
+
+
+def random_policy(manager, quests, heroes, rng):
+    """Ordem das quests, heróis e tamanho da party sorteados."""
+    assignments = []
+    free = list(heroes)
+    quests = list(quests)
+    rng.shuffle(quests)
+    rng.shuffle(free)
+
+    for quest in quests:
+        if not free:
+            break
+        size = rng.randint(1, min(quest.max_heroes, len(free)))
+        party, free = free[:size], free[size:]
+        assignments.append((quest.id, [hero.id for hero in party]))
+
+    return assignments
+
+
+_calculator = QuestSuccessCalculator()
+
+def best_party_policy(manager, quests, heroes, rng):
+    """Para cada quest, na ordem do registro, escala a party de maior chance entre os livres."""
+    assignments = []
+    free = list(heroes)
+
+    for quest in quests:
+        if not free:
+            break
+        party, _ = _calculator.best_party(free, quest)
+        if not party:
+            continue
+        chosen = {id(hero) for hero in party}
+        free = [hero for hero in free if id(hero) not in chosen]
+        assignments.append((quest.id, [hero.id for hero in party]))
+
+    return assignments
+
+
+POLICIES = {
+    "greedy": greedy_policy,
+    "random": random_policy,
+    "best": best_party_policy,
+}
+
+
+# ════════════════════════════════════════════════════════════════
+# SIMULADOR
+# ════════════════════════════════════════════════════════════════
+
+class TurnSimulator:
+    """
+    Executa uma campanha headless e devolve um relatório de tempos.
+
+    O RNG global é semeado com `seed` (o jogo usa o módulo random), então a
+    mesma seed reproduz a mesma campanha. Os saves vão para um diretório
+    temporário, apagado no fim.
+    """
+
+    def __init__(self, policy="greedy", seed=0, turns=CHAPTER_TURN_LIMIT,
+                 trace_memory=True, quiet=True):
+        self.policy = POLICIES[policy] if isinstance(policy, str) else policy
+        self.seed = seed
+        self.turns = turns
+        self.trace_memory = trace_memory
+        self.quiet = quiet
+
+        self.section_time = defaultdict(float)
+        self.section_calls = defaultdict(int)
+
+    # ──────────────────────────────────────────────────────────────────────────
+    # Medição
+    # ──────────────────────────────────────────────────────────────────────────
+
+    def _timed(self, section, func):
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.section_time[section] += time.perf_counter() - start
+                self.section_calls[section] += 1
+        return wrapper
+
+    def _instrument(self, manager):
+        """Embrulha os métodos da instância (não da classe) que queremos medir."""
+        manager.available_quests = self._timed("available_quests", manager.available_quests)
+        manager.resolve_quest = self._timed("resolve_quest", manager.resolve_quest)
+        manager._ensure_procedural_pool = self._timed(
+            "procedural", manager._ensure_procedural_pool
+        )
+
+    # ──────────────────────────────────────────────────────────────────────────
+    # Execução
+    # ──────────────────────────────────────────────────────────────────────────
+
+    def run(self) -> dict:
+        random.seed(self.seed)
+        rng = random.Random(self.seed)
+
+        save_dir = tempfile.mkdtemp(prefix="guild_sim_")
+        original_save_dir = save_manager.SAVE_DIR
+        original_save_game = quest_manager_module.save_game_async
+        save_manager.SAVE_DIR = save_dir
+        quest_manager_module.save_game_async = self._timed("save_game", original_save_game)
+
+        self.section_time.clear()
+        self.section_calls.clear()
+
+        if self.trace_memory:
+            tracemalloc.start()
+
+        try:
+            with self._output():
+                started = time.perf_counter()
+                manager = quest_manager_module.QuestManager(save_file=f"sim_{self.seed}.json")
+                setup_time = time.perf_counter() - started
+                self._instrument(manager)
+
+                turn_times = []
+                for _ in range(self.turns):
+                    started = time.perf_counter()
+                    self._play_turn(manager, rng)
+                    turn_times.append(time.perf_counter() - started)
+
+                # "save_game" mede só o custo na thread principal; a escrita é de fundo
+                save_manager.flush_saves()
+
+            peak_memory = tracemalloc.get_traced_memory()[1] if self.trace_memory else None
+        finally:
+            if self.trace_memory:
+                tracemalloc.stop()
+            save_manager.flush_saves()
+            quest_manager_module.save_game_async = original_save_game
+            save_manager.SAVE_DIR = original_save_dir
+            shutil.rmtree(save_dir, ignore_errors=True)
+
+        return self._report(manager, setup_time, turn_times, peak_memory)
+
+    def _play_turn(self, manager, rng):
+        hero_manager = manager.hero_manager
+
+        quests = manager.available_quests()
+        heroes = hero_manager.get_available_heroes()
+        for quest_id, hero_ids in self.policy(manager, quests, heroes, rng):
+            manager.send_heroes_on_quest(quest_id, hero_ids)
+
+        manager.advance_turn()
+        hero_manager.check_hero_unlocks(manager.completed_quests, manager.current_turn)
+
+    def _output(self):
+        if not self.quiet:
+            return contextlib.nullcontext()
+        return _silenced()
+
+    # ──────────────────────────────────────────────────────────────────────────
+    # Relatório
+    # ──────────────────────────────────────────────────────────────────────────
+
+    def _report(self, manager, setup_time, turn_times, peak_memory) -> dict:
+        ordered = sorted(turn_times)
+        total = sum(turn_times)
+
+        return {
+            "seed": self.seed,
+            "turns": len(turn_times),
+            "setup_time": setup_time,
+            "total_time": total,
+            "turn_times": turn_times,
+            "turn_mean": total / len(turn_times) if turn_times else 0.0,
+            "turn_p95": ordered[int(len(ordered) * 0.95)] if ordered else 0.0,
+            "turn_max": ordered[-1] if ordered else 0.0,
+            "sections": {
+                section: {
+                    "time": self.section_time[section],
+                    "calls": self.section_calls[section],
+                }
+                for section in SECTIONS
+            },
+            "peak_memory": peak_memory,
+            "completed": len(manager.completed_quests),
+            "failed": len(manager.failed_quests),
+            "registry_size": len(manager.quest_registry),
+            "archived": len(manager.archived_quests),
+            "reconstructed_cache": manager.reconstructed_cache_stats(),
+        }
+
+
+# ════════════════════════════════════════════════════════════════
+# BENCHMARK
+# ════════════════════════════════════════════════════════════════
+
+def run_benchmark(seeds=(1, 2, 3), turns=CHAPTER_TURN_LIMIT, policy="greedy",
+                  trace_memory=True) -> list[dict]:
+    """Uma campanha por seed; seeds fixas tornam os números comparáveis entre versões."""
+    return [
+        TurnSimulator(policy=policy, seed=seed, turns=turns, trace_memory=trace_memory).run()
+        for seed in seeds
+    ]
+
+
+def measure_quest_memory(count=1000, quest_type="fight", party_level=1, seed=0,
+                         language="en") -> dict:
+    """
+    Memória retida por `count` quests procedurais (como ficam no quest_registry).
+
+    Algumas quests são geradas antes para aquecer os caches do gerador, e só
+    conta a memória devolvida quando as quests são soltas.
+    """
+    random.seed(seed)
+
+    with _silenced():
+        proc_gen = ProceduralQuestSystem(language=language, data_file="data/quest_data.json")
+        for _ in range(10):
+            proc_gen.generate_quest_of_type(quest_type, party_level)
+
+        tracemalloc.start()
+        try:
+            quests = [proc_gen.generate_quest_of_type(quest_type, party_level) for _ in range(count)]
+            generated = len(quests)
+
+            # Mede o que é liberado ao soltar as quests: caches do gerador ficam de fora
+            with_quests = tracemalloc.get_traced_memory()[0]
+            del quests
+            retained = with_quests - tracemalloc.get_traced_memory()[0]
+        finally:
+            tracemalloc.stop()
+
+    return {
+        "count": generated,
+        "retained_bytes": retained,
+        "bytes_per_quest": retained / generated if generated else 0.0,
+        "bytes_per_1000": retained * 1000 / generated if generated else 0.0,
+    }
+
+
+def format_report(report: dict) -> str:
+    lines = [
+        f"seed {report['seed']}: {report['turns']} turnos em {report['total_time']:.3f}s "
+        f"(setup {report['setup_time']:.3f}s)",
+        f"  turno: média {report['turn_mean'] * 1000:.2f}ms | "
+        f"p95 {report['turn_p95'] * 1000:.2f}ms | máx {report['turn_max'] * 1000:.2f}ms",
+    ]
+
+    for section, stats in report["sections"].items():
+        lines.append(f"  {section:<17s} {stats['time']:8.3f}s  ({stats['calls']} chamadas)")
+
+    if report["peak_memory"] is not None:
+        lines.append(f"  pico de memória   {report['peak_memory'] / (1024 * 1024):8.2f} MiB")
+
+    lines.append(
+        f"  quests: {report['completed']} concluídas, {report['failed']} falhadas, "
+        f"{report['registry_size']} no registro, {report['archived']} arquivadas"
+    )
+
+    cache = report["reconstructed_cache"]
+    lines.append(
+        f"  reconstruídas: {cache['size']}/{cache['capacity']} em cache, "
+        f"{cache['hits']} hits, {cache['misses']} misses"
+    )
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark headless do loop de turnos.")
+    parser.add_argument("--turns", type=int, default=CHAPTER_TURN_LIMIT)
+    parser.add_argument("--seeds", type=int, nargs="+", default=[1, 2, 3])
+    parser.add_argument("--policy", choices=sorted(POLICIES), default="greedy")
+    parser.add_argument("--no-memory", action="store_true",
+                        help="não usa tracemalloc (tempos mais próximos do jogo real)")
+    parser.add_argument("--quest-memory", type=int, metavar="N", default=0,
+                        help="mede a memória retida por N quests procedurais e sai")
+    args = parser.parse_args(argv)
+
+    if args.quest_memory:
+        memory = measure_quest_memory(args.quest_memory)
+        print(
+            f"{memory['count']} quests: {memory['retained_bytes'] / 1024:.1f} KiB "
+            f"({memory['bytes_per_1000'] / 1024:.1f} KiB por 1000 quests, "
+            f"{memory['bytes_per_quest']:.0f} B por quest)"
+        )
+        return
+
+    reports = run_benchmark(args.seeds, args.turns, args.policy, not args.no_memory)
+    for report in reports:
+        print(format_report(report))
+
+    total = sum(report["total_time"] for report in reports)
+    print(f"\nTotal: {total:.3f}s em {len(reports)} campanha(s)")
+
+
+if __name__ == "__main__":
+    main()
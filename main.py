@@ -17,8 +17,9 @@ try:
     from screens.responsive_frame import ResponsiveFrame
     from core.quest_manager import QuestManager
     from core.hero_manager import HeroManager
-    from core.language_manager import LanguageManager
+    from core.language_manager import get_language_manager
     from core.font_manager import FontManager
+    from core.save_manager import flush_saves
     import traceback
     from kivy.core.window import Window
     from datetime import datetime
@@ -50,7 +51,7 @@ try:
             FontManager.register_fonts()
             
             # Cria gerenciador de idiomas
-            self.lm = LanguageManager()
+            self.lm = get_language_manager()
             
             # ✅ Define fonte inicial baseada no idioma
             self.font_name = FontManager.get_font_for_language(self.lm.language)
@@ -65,6 +66,10 @@ try:
             self.icon = "assets/icon.ico"
             return sm
         
+        def on_stop(self):
+            # Autosave roda em segundo plano: espera a última escrita terminar
+            flush_saves()
+
         def change_language(self, language: str):
             """
             Troca o idioma do jogo e atualiza a fonte automaticamente.
@@ -77,15 +82,10 @@ try:
             
             # ✅ Atualiza fonte (isso dispara atualização em TODOS os widgets)
             self.font_name = FontManager.get_font_for_language(language)
-            
-            if hasattr(self, 'root') and hasattr(self.root, 'hero_manager'):
-                self.root.hero_manager.load_heroes(language)
-
-            # 🔹 Recarrega os dados dependentes do idioma
-            if hasattr(self, 'root') and hasattr(self.root, 'quest_manager'):
-                self.root.quest_manager.load_quests(language)
 
-            # 🔹 Notifica telas ativas
+            # 🔹 Heróis e quests traduzem na leitura pelo idioma ativo: nada é
+            # recarregado do disco e o progresso (XP, status, turnos) continua.
+            # Só as telas ativas precisam redesenhar
             if hasattr(self.root, "current_screen") and hasattr(self.root.current_screen, "on_language_changed"):
 
                 self.root.current_screen.on_language_changed(language)
@@ -3,7 +3,7 @@ from kivy.uix.boxlayout import BoxLayout
 from kivy.uix.button import Button
 from kivy.uix.label import Label
 from kivy.graphics import Color, Rectangle
-from core.language_manager import LanguageManager  # ✅ IMPORT DIRETO
+from core.language_manager import get_language_manager  # ✅ IMPORT DIRETO
 
 
 class ConfirmationPopup(Popup):
@@ -24,8 +24,8 @@ class ConfirmationPopup(Popup):
         """
         super().__init__(**kwargs)
         
-        # ✅ Instancia o LanguageManager internamente
-        self.lm = LanguageManager()
+        # ✅ LanguageManager compartilhado (já no idioma atual)
+        self.lm = get_language_manager()
         
         # ✅ Busca as traduções automaticamente
         self.title = self.lm.t(title_key)
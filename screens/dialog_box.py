@@ -47,7 +47,7 @@ class DialogueBox:
         # Determina qual método usar baseado no resultado
         if result == "start":
             # ✅ Diálogo inicial (ao começar quest)
-            dialogues = self.dm.get_start_dialogue(heroes)
+            dialogues = self.dm.get_start_dialogue(heroes, quest_id=quest_id)
         else:
             # ✅ Diálogo de resultado (após completar)
             dialogues = self.dm.show_quest_dialogue(
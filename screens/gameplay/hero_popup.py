@@ -3,12 +3,12 @@ from kivy.uix.label import Label
 from kivy.uix.popup import Popup
 from kivy.uix.image import Image
 from kivy.uix.scrollview import ScrollView
-from core.language_manager import LanguageManager
+from core.language_manager import get_language_manager
 from core.hero import Hero
 
 
 def show_hero_details(screen_instance, hero, parent_size):
-    lm = getattr(screen_instance, "lm", LanguageManager())
+    lm = getattr(screen_instance, "lm", None) or get_language_manager()
     language = lm.language
     frame_width, frame_height = parent_size
 
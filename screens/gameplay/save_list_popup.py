@@ -1,14 +1,18 @@
 from pathlib import Path
 
+from core.save_manager import SAVE_SUFFIXES, save_slot_name
+
 SAVE_FOLDER = Path("saves")
 
 def list_saves():
     SAVE_FOLDER.mkdir(exist_ok=True)
 
     saves = []
-    for file in SAVE_FOLDER.glob("*.json"):
+    for file in SAVE_FOLDER.iterdir():
+        if not file.name.endswith(SAVE_SUFFIXES):
+            continue
         saves.append({
-            "name": file.stem,
+            "name": save_slot_name(file.name),
             "modified": file.stat().st_mtime
         })
 
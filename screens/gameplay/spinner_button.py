@@ -152,7 +152,7 @@ class InfoMenuSpinner:
         stats_text = f"""
         Guilda: {self.manager.guild_name or "Iron Rose"}
         
-        Heróis Ativos: {len(self.manager.hero_manager.heroes)}
+        Heróis Ativos: {len(self.manager.hero_manager.unlocked_heroes)}
         Missões Completas: {len(self.manager.quest_manager.completed_quests)}
         Ouro Total: {self.manager.gold}
         
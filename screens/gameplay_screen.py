@@ -11,9 +11,9 @@ from kivy.app import App
 from kivy.core.window import Window
 from kivy.properties import StringProperty
 from functools import partial
-from core.quest_success_calculator import calculate_success_chance
+from core.quest_success_calculator import calculate_success_chance, find_best_party
 from core.dialogue_manager import DialogueManager
-from core.language_manager import LanguageManager
+from core.language_manager import get_language_manager
 from screens.dialog_box import DialogueBox
 import core.save_manager as save
 import re
@@ -39,7 +39,7 @@ class GameplayScreen(Screen):
 
     def on_enter(self):
         self.qm = self.manager.quest_manager  
-        self.lm = LanguageManager()
+        self.lm = get_language_manager()
         self.pause_popup = None
 
         self.qm.hero_manager.check_hero_unlocks(self.qm.completed_quests, self.qm.current_turn)
@@ -48,6 +48,7 @@ class GameplayScreen(Screen):
 
         self.dialog_box = DialogueBox(self.dm)
         self.info_menu = InfoMenuSpinner(manager_instance=self)
+        self._build_sidebar_toolbar()
 
     # 🚀 Atualiza o assistant já existente do QuestManager
         if self.qm.assistant:
@@ -172,35 +173,66 @@ class GameplayScreen(Screen):
     def update_sidebar(self):
         qm = self.manager.quest_manager
 
-        # Limpa listas
-        self.ids.active_quests.clear_widgets()
-        self.ids.available_quests.clear_widgets()
-        self.ids.completed_quests.clear_widgets()
-
-        self.lm.t("mission_log")
-
-        for quest in qm.get_active_quests():
-            self.ids.active_quests.add_widget(
-                Button(
-                    text=quest.name,
-                    size_hint_y=None,
-                    height=40,
-                    on_release=partial(self.show_active_quest_details, quest)
-                )
-            )
+        # QuestManager novo (ex.: continue/load): recomeça as listas do zero
+        if getattr(self, "_sidebar_qm", None) is not qm:
+            self._sidebar_qm = qm
+            self._sidebar_rows = {"active": {}, "available": {}}
+            self.ids.active_quests.clear_widgets()
+            self.ids.available_quests.clear_widgets()
+            qm.reset_quest_changes()
+
+        # Só as linhas que mudaram são criadas, removidas ou renomeadas
+        changes = qm.get_quest_changes()
+        self._apply_quest_changes(
+            self.ids.active_quests, "active", changes["active"], self.show_active_quest_details
+        )
+        self._apply_quest_changes(
+            self.ids.available_quests, "available", changes["available"], self.show_quest_details
+        )
 
-        for quest in qm.get_available_quests():
-            self.ids.available_quests.add_widget(
-                Button(
-                    text=quest.name,
-                    size_hint_y=None,
-                    height=40,
-                    on_release=partial(self.show_quest_details, quest)
-                )
+    def _apply_quest_changes(self, container, list_key, change, on_select):
+        qm = self.manager.quest_manager
+        rows = self._sidebar_rows[list_key]
+
+        for qid in change["removed"]:
+            button = rows.pop(qid, None)
+            if button is not None:
+                container.remove_widget(button)
+
+        for qid in change["updated"]:
+            quest = qm.get_quest(qid)
+            if quest and qid in rows:
+                rows[qid].text = quest.name
+
+        for qid in change["added"]:
+            quest = qm.get_quest(qid)
+            if not quest:
+                continue
+            button = Button(
+                text=quest.name,
+                size_hint_y=None,
+                height=40,
+                on_release=partial(self._on_sidebar_quest_release, qid, on_select)
             )
-
+            rows[qid] = button
+            container.add_widget(button)
+
+        # Reordena reaproveitando os mesmos botões, só se a ordem mudou
+        ordered = [rows[qid] for qid in change["order"] if qid in rows]
+        if list(reversed(container.children)) != ordered:
+            container.clear_widgets()
+            for button in ordered:
+                container.add_widget(button)
+
+    def _on_sidebar_quest_release(self, quest_id, on_select, *_):
+        quest = self.manager.quest_manager.get_quest(quest_id)
+        if quest:
+            on_select(quest)
+
+    def _build_sidebar_toolbar(self):
+        """Spinner de informações + engrenagem — criados uma vez por entrada na tela."""
         self.ids.completed_quests.clear_widgets()
-        
+
         # Cria o spinner e adiciona diretamente
         info_spinner = self.info_menu.create_menu_spinner()
         self.ids.completed_quests.add_widget(info_spinner)
@@ -292,6 +324,21 @@ class GameplayScreen(Screen):
         )
         container.add_widget(self.success_label)
 
+        # ═══════════════════════════════════════
+        # 🏆 MELHOR GRUPO (entre os elegíveis)
+        # ═══════════════════════════════════════
+        best_heroes, best_chance = find_best_party(eligible_heroes, quest)
+        if best_heroes:
+            names = ", ".join(hero.name for hero in best_heroes)
+            tier_text = self.lm.t(f"tier_{self.get_narrative_tier(best_chance)}")
+            container.add_widget(Label(
+                text=f"[b]{self.lm.t('best_party')}:[/b] {names} ({tier_text})",
+                markup=True,
+                color=(0.2, 0.5, 0.2, 1),
+                size_hint_y=None,
+                height=18
+            ))
+
         # ═══════════════════════════════════════
         # DESCRIÇÃO
         # ═══════════════════════════════════════
@@ -580,7 +627,7 @@ class GameplayScreen(Screen):
             return
 
         # Pega os objetos dos heróis selecionados
-        heroes = [self.qm.get_hero(hid) for hid in hero_ids if self.qm.get_hero(hid)]
+        heroes = [hero for hid in hero_ids if (hero := self.qm.get_hero(hid))]
 
         # 🔹 Chama o QuestManager para registrar a missão
         self.qm.send_heroes_on_quest(quest.id, hero_ids)
@@ -657,11 +704,7 @@ class GameplayScreen(Screen):
     def update_success_label(self, quest):
         """Atualiza a taxa de sucesso no label quando heróis são selecionados."""
         hero_ids = self.pending_assignments.get(quest.id, [])
-        heroes = [
-            self.qm.get_hero(hid)
-            for hid in hero_ids
-            if self.qm.get_hero(hid)
-        ]
+        heroes = [hero for hid in hero_ids if (hero := self.qm.get_hero(hid))]
 
         if not heroes:
             self.success_label.text = f"{self.lm.t('success_rate')}: --"
@@ -758,13 +801,12 @@ class GameplayScreen(Screen):
             saves_box.bind(minimum_height=saves_box.setter("height"))
 
             for save_name in existing_saves:
+                slot = save.save_slot_name(save_name)
                 btn = Button(
-                    text=save_name,
+                    text=slot,
                     size_hint_y=None,
                     height=40,
-                    on_release=lambda btn, name=save_name: setattr(
-                        input_name, "text", name.replace(".json", "")
-                    )
+                    on_release=lambda btn, name=slot: setattr(input_name, "text", name)
                 )
                 saves_box.add_widget(btn)
 
@@ -796,16 +838,16 @@ class GameplayScreen(Screen):
             self.qm._log(self.lm.t("invalid_name"))
             return
 
-        save_exists = filename in save.list_saves()
-        filename_json = f"{filename}.json"
+        # Slot sem extensão: o save_manager escolhe a do formato
+        save_exists = filename in {save.save_slot_name(f) for f in save.list_saves()}
 
         qm = self.manager.quest_manager
-        save.save_game(qm, filename_json)
+        save.save_game(qm, filename)
 
         if save_exists:
-            self.qm._log(self.lm.t("game_overwritten").format(filename=filename_json))
+            self.qm._log(self.lm.t("game_overwritten").format(filename=filename))
         else:
-            self.qm._log(self.lm.t("game_saved").format(filename=filename_json))
+            self.qm._log(self.lm.t("game_saved").format(filename=filename))
 
         if getattr(self, "save_popup", None):
             try:
@@ -853,6 +895,9 @@ class GameplayScreen(Screen):
                 pass
             self.pause_popup = None
 
+        # Garante que o último autosave está no disco antes do menu (continue/load)
+        save.flush_saves()
+
         # volta ao menu principal
         self.manager.current = "menu"
 
@@ -1,5 +1,4 @@
 # screens/load_game_screen.py
-import os
 from datetime import datetime
 from kivy.uix.screenmanager import Screen
 from kivy.uix.floatlayout import FloatLayout
@@ -12,24 +11,21 @@ from kivy.uix.image import Image
 from kivy.graphics import Color, Rectangle
 from core.music_manager import get_music_manager
 import core.save_manager as save
-from core.language_manager import LanguageManager
+from core.language_manager import get_language_manager
 from kivy.properties import StringProperty
 from kivy.core.window import Window
 
 
-SAVE_DIR = "saves"
-
 class LoadGameScreen(Screen):
     previous_screen = StringProperty('menu')
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        self.lm = LanguageManager()
+        self.lm = get_language_manager()
         self.saves_list = None
         self.build_ui()
 
     def on_pre_enter(self):
-        self.lm = LanguageManager()  # recarrega idioma atualizado
         self.refresh_saves()
         self.build_ui()
         Window.bind(on_keyboard=self._on_keyboard)
@@ -117,10 +113,9 @@ class LoadGameScreen(Screen):
         """Lista todos os saves disponíveis"""
         self.saves_list.clear_widgets()
         
-        if not os.path.exists(SAVE_DIR):
-            os.makedirs(SAVE_DIR)
-
-        files = [f for f in os.listdir(SAVE_DIR) if f.endswith(".json")]
+        # Tudo vem do índice de saves — nenhum arquivo de save é aberto aqui
+        files = save.list_saves()
+        index = save.load_save_index()
         
         if not files:
             self.saves_list.add_widget(Label(
@@ -132,8 +127,7 @@ class LoadGameScreen(Screen):
             return
 
         for f in files:
-            filepath = os.path.join(SAVE_DIR, f)
-            modified = datetime.fromtimestamp(os.path.getmtime(filepath))
+            modified = datetime.fromtimestamp(index.get(f, {}).get("saved_at", 0))
             date_str = modified.strftime("%d/%m/%Y %H:%M")
 
             row = BoxLayout(
@@ -145,7 +139,7 @@ class LoadGameScreen(Screen):
 
             # Nome do save + data
             row.add_widget(Label(
-                text=f"{f.replace('.json', '')} - {date_str}",
+                text=f"{save.save_slot_name(f)} - {date_str}",
                 color=(0.16, 0.09, 0.06, 1),
                 halign="left",
                 valign="middle"
@@ -178,7 +172,7 @@ class LoadGameScreen(Screen):
         content = BoxLayout(orientation="vertical", spacing=10, padding=10)
         
         content.add_widget(Label(
-            text=self.lm.t("confirm_delete_message").format(filename=filename.replace('.json', '')),
+            text=self.lm.t("confirm_delete_message").format(filename=save.save_slot_name(filename)),
             color=(0, 0, 0, 1)
         ))
 
@@ -212,9 +206,7 @@ class LoadGameScreen(Screen):
 
     def delete_save(self, filename):
         """Deleta um save"""
-        filepath = os.path.join(SAVE_DIR, filename)
-        if os.path.exists(filepath):
-            os.remove(filepath)
+        if save.delete_save(filename):
             print(f"[LoadGameScreen] Save deletado: {filename}")
         self.refresh_saves()
 
@@ -13,7 +13,7 @@ from kivy.core.window import Window
 from kivy.uix.image import Image
 from kivy.app import App
 from core.music_manager import get_music_manager
-from core.language_manager import LanguageManager
+from core.language_manager import get_language_manager
 from kivy.properties import StringProperty
 
 CONFIG_FILE = "config.json"
@@ -26,7 +26,7 @@ class SettingsScreen(Screen):
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        self.lm = LanguageManager()
+        self.lm = get_language_manager()
         self.config = self.load_config()
 
         self.music_volume_label = None